@@ -0,0 +1,89 @@
+"""Direct /proc readers used by `SystemMonitor` on Linux.
+
+Each function mirrors the psutil call it stands in for, but parses its file
+in a single read and returns plain tuples instead of namedtuples.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Tuple
+
+DISK_SECTOR_SIZE = 512
+
+
+def _read(path: str) -> bytes:
+    with open(path, "rb") as handle:
+        return handle.read()
+
+
+def _usage_percent(used: int, total: int) -> float:
+    return round(used / total * 100, 1) if total else 0.0
+
+
+def cpu_times() -> List[Tuple[float, float]]:
+    """Return (busy, total) jiffies per core, split like `psutil.cpu_percent`."""
+    cores: List[Tuple[float, float]] = []
+    for line in _read("/proc/stat").splitlines():
+        if not line.startswith(b"cpu"):
+            break
+        if line.startswith(b"cpu "):
+            continue
+        fields = [int(value) for value in line.split()[1:]]
+        fields += [0] * (10 - len(fields))
+        # user nice system idle iowait irq softirq steal guest guest_nice;
+        # guest time is already counted in user/nice.
+        total = sum(fields) - fields[8] - fields[9]
+        cores.append((total - fields[3] - fields[4], total))
+    return cores
+
+
+def memory() -> Tuple[int, int, int, float, int, int, int, float]:
+    """Return the `MemoryMetrics` fields in order from /proc/meminfo.
+
+    `used` is `MemTotal - MemAvailable` and `percent` is derived from it,
+    as in recent psutil releases; older ones subtract free, buffers and
+    cache instead, so `used` can differ from theirs. Swap is
+    `SwapTotal - SwapFree`.
+    """
+    info: Dict[bytes, int] = {}
+    for line in _read("/proc/meminfo").splitlines():
+        fields = line.split()
+        info[fields[0]] = int(fields[1]) * 1024
+    total = info[b"MemTotal:"]
+    available = info[b"MemAvailable:"]
+    if available < 0:
+        available = 0
+    elif available > total:
+        available = info[b"MemFree:"]
+    swap_total = info[b"SwapTotal:"]
+    swap_free = info[b"SwapFree:"]
+    swap_used = swap_total - swap_free
+    return (
+        total,
+        total - available,
+        available,
+        _usage_percent(total - available, total),
+        swap_total,
+        swap_used,
+        swap_free,
+        _usage_percent(swap_used, swap_total),
+    )
+
+
+def disk_io_per_device() -> Dict[str, Tuple[int, int]]:
+    """Return (read_bytes, write_bytes) for every disk and partition in /proc/diskstats."""
+    counters: Dict[str, Tuple[int, int]] = {}
+    for line in _read("/proc/diskstats").splitlines():
+        fields = line.split()
+        counters[fields[2].decode()] = (int(fields[5]) * DISK_SECTOR_SIZE, int(fields[9]) * DISK_SECTOR_SIZE)
+    return counters
+
+
+def net_io() -> Tuple[int, int]:
+    """Return (bytes_sent, bytes_recv) summed over every interface."""
+    sent = recv = 0
+    for line in _read("/proc/net/dev").splitlines()[2:]:
+        fields = line.split(b":", 1)[1].split()
+        recv += int(fields[0])
+        sent += int(fields[8])
+    return sent, recv
@@ -1,9 +1,13 @@
 """PyQt application for the System Optimizer."""
 
 from __future__ import annotations
+import functools
 import sys
+import time
+from array import array
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Iterable, List
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 try:
     from PyQt5 import QtChart
@@ -19,24 +23,97 @@ from PyQt5 import QtCore, QtGui, QtWidgets
 from .file_manager import DiskScanner, FileInfo, FileSearch, delete_files
 from .logging_config import configure_logging, get_logger
 from .logs import clear_logs, export_logs, generate_performance_report, read_logs
-from .monitor import SystemMonitor
+from .models import INV_GB, DiskModel, FileModel, NetworkModel, ProcessModel, ServiceModel
+from .monitor import DiskMetrics, MonitorSnapshot, SystemMonitor
 from .optimizer import (
     CpuTuner,
     DiskCleaner,
     MemoryTuner,
+    ServiceInfo,
     ServiceManager,
     SystemTuner,
     load_schedule_config,
     save_schedule_config,
 )
+from .workers import MonitorWorker, ScanWorker, TaskWorker
 
 APP_DIR = Path.home() / ".system_optimizer"
 APP_DIR.mkdir(parents=True, exist_ok=True)
 SCHEDULE_PATH = APP_DIR / "schedule.json"
+LOG_PAGE_LINES = 2000
+LOG_FILTER_DELAY_MS = 200
+FILE_TABLE_BATCH = 500
+SEARCH_CACHE_SIZE = 8
+SEARCH_CACHE_TTL = 30.0
 
 ui_logger = get_logger("UI")
 
 
+def _downsample_m4(values: Sequence[float], px_width: int) -> List[QtCore.QPointF]:
+    """Reduce `values` to the first, min, max and last point of each pixel column.
+
+    This is M4 aggregation: the drawn line is pixel-identical to plotting
+    every value, with at most four points per column.
+    """
+    count = len(values)
+    points: List[QtCore.QPointF] = []
+    for column in range(px_width):
+        start = column * count // px_width
+        end = (column + 1) * count // px_width
+        if start >= end:
+            continue
+        low = min(range(start, end), key=values.__getitem__)
+        high = max(range(start, end), key=values.__getitem__)
+        for index in sorted({start, low, high, end - 1}):
+            points.append(QtCore.QPointF(index, values[index]))
+    return points
+
+
+class ActionButtonsDelegate(QtWidgets.QStyledItemDelegate):
+    """Paint a row of push buttons in a cell without creating widgets.
+
+    Clicks are reported through `clicked` with the text of column 0 of the
+    row (the service name) and the action whose button was hit.
+    """
+
+    clicked = QtCore.pyqtSignal(str, str)
+
+    def __init__(self, actions: Sequence[str], parent: Optional[QtCore.QObject] = None) -> None:
+        super().__init__(parent)
+        self.actions = tuple(actions)
+
+    def _button_rects(self, rect: QtCore.QRect) -> List[QtCore.QRect]:
+        width = rect.width() // len(self.actions)
+        return [
+            QtCore.QRect(rect.x() + i * width, rect.y(), width, rect.height()).adjusted(1, 1, -1, -1)
+            for i in range(len(self.actions))
+        ]
+
+    def paint(self, painter: QtGui.QPainter, option: QtWidgets.QStyleOptionViewItem, index: QtCore.QModelIndex) -> None:
+        style = option.widget.style() if option.widget else QtWidgets.QApplication.style()
+        for action, rect in zip(self.actions, self._button_rects(option.rect)):
+            button = QtWidgets.QStyleOptionButton()
+            button.rect = rect
+            button.text = action.title()
+            button.state = QtWidgets.QStyle.State_Enabled | QtWidgets.QStyle.State_Raised
+            style.drawControl(QtWidgets.QStyle.CE_PushButton, button, painter, option.widget)
+
+    def editorEvent(
+        self,
+        event: QtCore.QEvent,
+        model: QtCore.QAbstractItemModel,
+        option: QtWidgets.QStyleOptionViewItem,
+        index: QtCore.QModelIndex,
+    ) -> bool:
+        if event.type() != QtCore.QEvent.MouseButtonRelease or event.button() != QtCore.Qt.LeftButton:
+            return False
+        for action, rect in zip(self.actions, self._button_rects(option.rect)):
+            if rect.contains(event.pos()):
+                self.clicked.emit(model.data(index.siblingAtColumn(0)), action)
+                return True
+        return False
+
+
 class MainWindow(QtWidgets.QMainWindow):
     """Main application window."""
 
@@ -48,8 +125,27 @@ class MainWindow(QtWidgets.QMainWindow):
         self.cpu_tuner = CpuTuner()
         self.memory_tuner = MemoryTuner()
         self.disk_cleaner = DiskCleaner()
-        self.system_tuner = SystemTuner()
+        self.system_tuner = SystemTuner(self.service_manager)
         self.schedule_config = load_schedule_config(SCHEDULE_PATH)
+        self._snapshot: Optional[MonitorSnapshot] = None
+        self._processes: List[tuple[int, str, float]] = []
+        self._chart_x_max: Dict[QtChart.QLineSeries, int] = {}
+        self._chart_y_max: Dict[QtChart.QLineSeries, float] = {}
+        self._label_keys: Dict[QtWidgets.QLabel, tuple] = {}
+        self._log_limit = LOG_PAGE_LINES
+        self._log_line_count = 0
+        self.log_entries: List[str] = []
+        self._file_generation = 0
+        self._search_cache: OrderedDict[Tuple[str, str, int], Tuple[float, List[FileInfo]]] = OrderedDict()
+        self._last_search: Optional[Tuple[str, str, int]] = None
+        self._log_entries_lower: Optional[List[str]] = None
+        self._log_filter = ""
+        self._log_matches: List[int] = []
+        self._logs_exhausted = False
+        self._loading_logs = False
+
+        self._dark_palette = self._build_dark_palette()
+        self._light_palette = self.style().standardPalette()
 
         self.setWindowTitle("System Optimizer")
         self.resize(1200, 800)
@@ -67,17 +163,34 @@ class MainWindow(QtWidgets.QMainWindow):
         self.tab_widget.addTab(self.logs_tab, "Logs & Reports")
         self.tab_widget.addTab(self.settings_tab, "Settings")
 
+        # Only the dashboard is built up front; the other tabs (and the
+        # systemctl, sysfs and log reads they need) wait for their first visit.
         self._build_dashboard_tab()
-        self._build_optimization_tab()
-        self._build_logs_tab()
-        self._build_settings_tab()
+        self._tab_builders: List[Optional[Callable[[], None]]] = [
+            None,
+            self._open_optimization_tab,
+            self._open_logs_tab,
+            self._build_settings_tab,
+        ]
+        self.tab_widget.currentChanged.connect(self._ensure_tab_built)
 
         self._init_timers()
+        ui_logger.info("Application UI initialized")
+
+    def _ensure_tab_built(self, index: int) -> None:
+        builder = self._tab_builders[index]
+        if builder is not None:
+            self._tab_builders[index] = None
+            builder()
+
+    def _open_optimization_tab(self) -> None:
+        self._build_optimization_tab()
         self.refresh_services()
         self.update_cpu_governor_ui()
-        self.refresh_recommendations()
+
+    def _open_logs_tab(self) -> None:
+        self._build_logs_tab()
         self.refresh_logs()
-        ui_logger.info("Application UI initialized")
 
     # ------------------ Dashboard Tab ------------------
     def _build_dashboard_tab(self) -> None:
@@ -93,6 +206,7 @@ class MainWindow(QtWidgets.QMainWindow):
         # CPU Chart
         self.cpu_chart = QtChart.QChart()
         self.cpu_series = QtChart.QLineSeries()
+        self.cpu_points = self._chart_points(self.monitor.cpu_history.maxlen)
         self.cpu_chart.addSeries(self.cpu_series)
         self.cpu_chart.createDefaultAxes()
         self.cpu_chart.setTitle("CPU Usage (%)")
@@ -100,11 +214,13 @@ class MainWindow(QtWidgets.QMainWindow):
         self.cpu_chart.axisY().setRange(0, 100)
         self.cpu_chart.legend().hide()
         self.cpu_chart_view = QtChart.QChartView(self.cpu_chart)
+        self.cpu_chart_view.setRenderHint(QtGui.QPainter.Antialiasing, False)
         stats_layout.addWidget(self.cpu_chart_view, 1)
 
         # Memory Chart
         self.memory_chart = QtChart.QChart()
         self.memory_series = QtChart.QLineSeries()
+        self.memory_points = self._chart_points(self.monitor.memory_history.maxlen)
         self.memory_chart.addSeries(self.memory_series)
         self.memory_chart.createDefaultAxes()
         self.memory_chart.setTitle("Memory Usage (%)")
@@ -112,25 +228,29 @@ class MainWindow(QtWidgets.QMainWindow):
         self.memory_chart.axisY().setRange(0, 100)
         self.memory_chart.legend().hide()
         self.memory_chart_view = QtChart.QChartView(self.memory_chart)
+        self.memory_chart_view.setRenderHint(QtGui.QPainter.Antialiasing, False)
         stats_layout.addWidget(self.memory_chart_view, 1)
 
         # Network Chart
         self.network_chart = QtChart.QChart()
         self.network_series = QtChart.QLineSeries()
+        self.network_points = self._chart_points(self.monitor.network_history.maxlen)
         self.network_chart.addSeries(self.network_series)
         self.network_chart.createDefaultAxes()
         self.network_chart.setTitle("Network Activity (bytes/s)")
         self.network_chart.axisX().setRange(0, 60)
         self.network_chart.legend().hide()
         self.network_chart_view = QtChart.QChartView(self.network_chart)
+        self.network_chart_view.setRenderHint(QtGui.QPainter.Antialiasing, False)
         stats_layout.addWidget(self.network_chart_view, 1)
 
         # CPU Info
         self.cpu_info_label = QtWidgets.QLabel("CPU Info")
         self.memory_info_label = QtWidgets.QLabel("Memory Info")
-        self.disk_table = QtWidgets.QTableWidget(0, 5)
-        self.disk_table.setHorizontalHeaderLabels(["Mount", "Used (GB)", "Free (GB)", "Usage %", "R/W (bytes)"])
-        self.disk_table.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
+        self.disk_model = DiskModel(self)
+        self.disk_table = QtWidgets.QTableView()
+        self.disk_table.setModel(self.disk_model)
+        self._configure_columns(self.disk_table, (None, 110, 110, 90, 160))
 
         info_layout = QtWidgets.QVBoxLayout()
         info_layout.addWidget(self.cpu_info_label)
@@ -139,19 +259,36 @@ class MainWindow(QtWidgets.QMainWindow):
         layout.addLayout(info_layout)
 
         # Process table
-        self.process_table = QtWidgets.QTableWidget(0, 3)
-        self.process_table.setHorizontalHeaderLabels(["PID", "Process", "CPU %"])
-        self.process_table.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
+        self.process_model = ProcessModel(self)
+        self.process_table = QtWidgets.QTableView()
+        self.process_table.setModel(self.process_model)
+        self._configure_columns(self.process_table, (90, None, 90))
         layout.addWidget(QtWidgets.QLabel("Top Processes"))
         layout.addWidget(self.process_table)
 
         # Network connections table
-        self.network_table = QtWidgets.QTableWidget(0, 3)
-        self.network_table.setHorizontalHeaderLabels(["Type", "Local", "Remote/Status"])
-        self.network_table.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
+        self.network_model = NetworkModel(self)
+        self.network_table = QtWidgets.QTableView()
+        self.network_table.setModel(self.network_model)
+        self._configure_columns(self.network_table, (110, None, None))
         layout.addWidget(QtWidgets.QLabel("Network Connections"))
         layout.addWidget(self.network_table)
 
+    @staticmethod
+    def _configure_columns(table: QtWidgets.QTableView, widths: Sequence[Optional[int]]) -> None:
+        """Size columns once up front; `None` marks columns that share the spare width.
+
+        Rows get a fixed height so refreshes never query per-row size hints.
+        """
+        table.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Fixed)
+        header = table.horizontalHeader()
+        header.setSectionResizeMode(QtWidgets.QHeaderView.Interactive)
+        for column, width in enumerate(widths):
+            if width is None:
+                header.setSectionResizeMode(column, QtWidgets.QHeaderView.Stretch)
+            else:
+                table.setColumnWidth(column, width)
+
     # ------------------ Optimization Tab ------------------
     def _build_optimization_tab(self) -> None:
         layout = QtWidgets.QVBoxLayout()
@@ -160,20 +297,20 @@ class MainWindow(QtWidgets.QMainWindow):
         # Service management
         service_group = QtWidgets.QGroupBox("Service Management")
         service_layout = QtWidgets.QVBoxLayout()
-        self.service_table = QtWidgets.QTableWidget(0, 6)
-        self.service_table.setHorizontalHeaderLabels([
-            "Service",
-            "Load",
-            "Active",
-            "Sub",
-            "Start/Stop",
-            "Enable/Disable",
-        ])
-        self.service_table.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
+        self.service_model = ServiceModel(self)
+        self.service_table = QtWidgets.QTableView()
+        self.service_table.setModel(self.service_model)
+        start_stop_delegate = ActionButtonsDelegate(("start", "stop"), self.service_table)
+        start_stop_delegate.clicked.connect(self._service_action)
+        self.service_table.setItemDelegateForColumn(4, start_stop_delegate)
+        enable_disable_delegate = ActionButtonsDelegate(("enable", "disable"), self.service_table)
+        enable_disable_delegate.clicked.connect(self._service_action)
+        self.service_table.setItemDelegateForColumn(5, enable_disable_delegate)
+        self._configure_columns(self.service_table, (None, 90, 90, 90, 170, 170))
         service_layout.addWidget(self.service_table)
-        refresh_services_btn = QtWidgets.QPushButton("Refresh Services")
-        refresh_services_btn.clicked.connect(self.refresh_services)
-        service_layout.addWidget(refresh_services_btn)
+        self.refresh_services_btn = QtWidgets.QPushButton("Refresh Services")
+        self.refresh_services_btn.clicked.connect(self.refresh_services)
+        service_layout.addWidget(self.refresh_services_btn)
         service_group.setLayout(service_layout)
         layout.addWidget(service_group)
 
@@ -198,9 +335,14 @@ class MainWindow(QtWidgets.QMainWindow):
         self.swappiness_slider.setRange(0, 100)
         current_swappiness = self.memory_tuner.swappiness() or 60
         self.swappiness_slider.setValue(current_swappiness)
-        self.swappiness_slider.valueChanged.connect(self.update_swappiness_label)
         memory_layout.addWidget(self.swappiness_slider)
         self.swappiness_label = QtWidgets.QLabel(str(current_swappiness))
+        # Dragging emits valueChanged per step; only repaint the label once it settles.
+        self.swappiness_label_timer = QtCore.QTimer(self)
+        self.swappiness_label_timer.setSingleShot(True)
+        self.swappiness_label_timer.setInterval(50)
+        self.swappiness_label_timer.timeout.connect(self.update_swappiness_label)
+        self.swappiness_slider.valueChanged.connect(self.schedule_swappiness_label)
         memory_layout.addWidget(self.swappiness_label)
         apply_swappiness_btn = QtWidgets.QPushButton("Apply")
         apply_swappiness_btn.clicked.connect(self.apply_swappiness)
@@ -246,25 +388,37 @@ class MainWindow(QtWidgets.QMainWindow):
         self.search_size_input.setRange(0, 10_000_000)
         self.search_size_input.setPrefix(">=")
         self.search_size_input.setSuffix(" bytes")
-        search_btn = QtWidgets.QPushButton("Search")
-        search_btn.clicked.connect(self.search_files)
+        self.search_btn = QtWidgets.QPushButton("Search")
+        self.search_btn.clicked.connect(self.search_files)
         search_layout.addWidget(self.search_name_input)
         search_layout.addWidget(self.search_ext_input)
         search_layout.addWidget(self.search_size_input)
-        search_layout.addWidget(search_btn)
+        search_layout.addWidget(self.search_btn)
         file_layout.addLayout(search_layout)
 
-        self.file_table = QtWidgets.QTableWidget(0, 2)
-        self.file_table.setHorizontalHeaderLabels(["Path", "Size (bytes)"])
-        self.file_table.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
+        self.file_model = FileModel(self)
+        self.file_table = QtWidgets.QTableView()
+        self.file_table.setModel(self.file_model)
+        self._configure_columns(self.file_table, (None, 130))
+        # Scan results can run to thousands of rows: compact rows and eliding
+        # long paths avoids laying them out.
+        self.file_table.verticalHeader().setDefaultSectionSize(20)
+        self.file_table.setTextElideMode(QtCore.Qt.ElideMiddle)
+        self.file_table.setWordWrap(False)
         file_layout.addWidget(self.file_table)
         delete_btn = QtWidgets.QPushButton("Delete Selected Files")
         delete_btn.clicked.connect(self.delete_selected_files)
         file_layout.addWidget(delete_btn)
-        scan_btn = QtWidgets.QPushButton("Scan for Large Files")
-        scan_btn.clicked.connect(self.scan_large_files)
-        file_layout.addWidget(scan_btn)
+        self.scan_btn = QtWidgets.QPushButton("Scan for Large Files")
+        self.scan_btn.clicked.connect(self.scan_large_files)
+        file_layout.addWidget(self.scan_btn)
         file_group.setLayout(file_layout)
+
+        self.file_progress = QtWidgets.QProgressBar()
+        self.file_progress.setRange(0, 0)
+        self.file_progress.setMaximumWidth(150)
+        self.file_progress.hide()
+        self.statusBar().addPermanentWidget(self.file_progress)
         layout.addWidget(file_group)
 
     # ------------------ Logs Tab ------------------
@@ -287,8 +441,19 @@ class MainWindow(QtWidgets.QMainWindow):
         button_layout.addWidget(report_btn)
         layout.addLayout(button_layout)
 
+        self.log_filter_input = QtWidgets.QLineEdit()
+        self.log_filter_input.setPlaceholderText("Filter logs...")
+        # Filter once typing pauses instead of rescanning the logs per keystroke.
+        self.log_filter_timer = QtCore.QTimer(self)
+        self.log_filter_timer.setSingleShot(True)
+        self.log_filter_timer.setInterval(LOG_FILTER_DELAY_MS)
+        self.log_filter_timer.timeout.connect(self.apply_log_filter)
+        self.log_filter_input.textChanged.connect(self.schedule_log_filter)
+        layout.addWidget(self.log_filter_input)
+
         self.log_view = QtWidgets.QPlainTextEdit()
         self.log_view.setReadOnly(True)
+        self.log_view.verticalScrollBar().valueChanged.connect(self._on_log_scrolled)
         layout.addWidget(self.log_view)
 
     # ------------------ Settings Tab ------------------
@@ -323,9 +488,22 @@ class MainWindow(QtWidgets.QMainWindow):
 
     # ------------------ Timers ------------------
     def _init_timers(self) -> None:
-        self.update_timer = QtCore.QTimer(self)
-        self.update_timer.timeout.connect(self.refresh_dashboard)
-        self.update_timer.start(1000)
+        # Sampling runs on its own thread so slow psutil calls never stall painting.
+        self.monitor_thread = QtCore.QThread(self)
+        self.monitor_worker = MonitorWorker(self.monitor)
+        self.monitor_worker.moveToThread(self.monitor_thread)
+        self.monitor_thread.started.connect(self.monitor_worker.start)
+        self.monitor_thread.finished.connect(self.monitor_worker.deleteLater)
+        self.monitor_worker.snapshot.connect(self._on_snapshot)
+        self.monitor_thread.start()
+
+        # Coalesces chart repaints so bursts of samples cost a single redraw.
+        self.chart_timer = QtCore.QTimer(self)
+        self.chart_timer.setSingleShot(True)
+        self.chart_timer.setInterval(50)
+        self.chart_timer.timeout.connect(self._render_charts)
+
+        self.tab_widget.currentChanged.connect(self._on_tab_changed)
 
         self.schedule_timer = QtCore.QTimer(self)
         self.schedule_timer.timeout.connect(self.execute_scheduled_tasks)
@@ -339,99 +517,130 @@ class MainWindow(QtWidgets.QMainWindow):
             self.schedule_timer.stop()
 
     # ------------------ Dashboard updates ------------------
-    def refresh_dashboard(self) -> None:
-        cpu = self.monitor.cpu_metrics()
-        mem = self.monitor.memory_metrics()
-        disk = self.monitor.disk_metrics()
-        net = self.monitor.network_metrics()
+    def _dashboard_visible(self) -> bool:
+        return self.tab_widget.currentWidget() is self.dashboard_tab
 
-        self._update_chart(self.cpu_series, list(self.monitor.cpu_history))
-        self._update_chart(self.memory_series, list(self.monitor.memory_history))
-        self._update_chart(self.network_series, list(self.monitor.network_history))
+    def _on_tab_changed(self, index: int) -> None:
+        visible = self._dashboard_visible()
+        self.monitor_worker.sample_processes = visible
+        if visible:
+            self._render_dashboard()
 
-        self.cpu_info_label.setText(
-            f"CPU Usage: {cpu.total:.2f}% | Per Core: {', '.join(f'{core:.1f}%' for core in cpu.per_core)} | Temp: {cpu.temperature or 'N/A'}"
-        )
-        self.memory_info_label.setText(
-            f"Memory: {mem.used / (1024 ** 3):.2f} GB used / {mem.total / (1024 ** 3):.2f} GB | Swap: {mem.swap_used / (1024 ** 3):.2f} GB"
-        )
+    def refresh_dashboard(self) -> None:
+        """Ask the monitor thread for a fresh sample outside its regular tick."""
+        QtCore.QMetaObject.invokeMethod(self.monitor_worker, "sample", QtCore.Qt.QueuedConnection)
 
-        self._update_disk_table(disk)
-        self._update_process_table(self.monitor.running_processes())
-        self._update_network_table(net.connections)
+    def _on_snapshot(self, snapshot: MonitorSnapshot) -> None:
+        self._snapshot = snapshot
+        if snapshot.processes is not None:
+            self._processes = snapshot.processes
+        if self._dashboard_visible():
+            self._render_dashboard()
 
-        if cpu.total > 90:
+        if snapshot.cpu.total > 90:
             self.statusBar().showMessage("High CPU usage detected!", 2000)
-        elif mem.percent > 90:
+        elif snapshot.memory.percent > 90:
             self.statusBar().showMessage("High memory usage detected!", 2000)
 
-    def _update_chart(self, series: QtChart.QLineSeries, data: List[float]) -> None:
-        series.clear()
-        for index, value in enumerate(reversed(data)):
-            series.append(index, value)
-        axis_x = series.chart().axisX()
-        if axis_x:
-            axis_x.setRange(0, max(60, len(data)))
-
-    def _update_disk_table(self, disk_metrics: Dict[str, object]) -> None:
-        self.disk_table.setRowCount(len(disk_metrics))
-        for row, (mount, metrics) in enumerate(disk_metrics.items()):
-            used_gb = metrics.used / (1024 ** 3)
-            free_gb = metrics.free / (1024 ** 3)
-            rw = f"{metrics.read_bytes}/{metrics.write_bytes}"
-            for column, value in enumerate([mount, f"{used_gb:.2f}", f"{free_gb:.2f}", f"{metrics.percent:.2f}", rw]):
-                item = QtWidgets.QTableWidgetItem(str(value))
-                self.disk_table.setItem(row, column, item)
+    def _render_dashboard(self) -> None:
+        if self._snapshot is None:
+            return
+        cpu, mem = self._snapshot.cpu, self._snapshot.memory
+
+        if not self.chart_timer.isActive():
+            self.chart_timer.start()
+
+        # Labels are keyed on the values as displayed, so float noise below
+        # the shown precision neither rebuilds the text nor repaints the label.
+        cpu_key = (round(cpu.total, 2), tuple(round(core, 1) for core in cpu.per_core), cpu.temperature)
+        if self._label_keys.get(self.cpu_info_label) != cpu_key:
+            self._label_keys[self.cpu_info_label] = cpu_key
+            self.cpu_info_label.setText(
+                f"CPU Usage: {cpu.total:.2f}% | Per Core: {', '.join(f'{core:.1f}%' for core in cpu.per_core)} | Temp: {cpu.temperature or 'N/A'}"
+            )
+        used_gb, total_gb, swap_gb = mem.used * INV_GB, mem.total * INV_GB, mem.swap_used * INV_GB
+        mem_key = (round(used_gb, 2), round(total_gb, 2), round(swap_gb, 2))
+        if self._label_keys.get(self.memory_info_label) != mem_key:
+            self._label_keys[self.memory_info_label] = mem_key
+            self.memory_info_label.setText(f"Memory: {used_gb:.2f} GB used / {total_gb:.2f} GB | Swap: {swap_gb:.2f} GB")
+
+        self._update_disk_table(self._snapshot.disk)
+        self._update_process_table(self._processes)
+        self._update_network_table(self._snapshot.network.connections)
+
+    def _render_charts(self) -> None:
+        # Draw from the snapshot's copies; the live histories belong to the worker thread.
+        snapshot = self._snapshot
+        if snapshot is None:
+            return
+        self._update_chart(self.cpu_series, snapshot.cpu_history, self.cpu_points)
+        self._update_chart(self.memory_series, snapshot.memory_history, self.memory_points)
+        self._update_chart(self.network_series, snapshot.network_history, self.network_points)
+        self._scale_y_axis(self.network_series, snapshot.network_stats)
+
+    @staticmethod
+    def _chart_points(size: int) -> List[QtCore.QPointF]:
+        return [QtCore.QPointF(index, 0.0) for index in range(size)]
+
+    def _update_chart(self, series: QtChart.QLineSeries, data: array, points: List[QtCore.QPointF]) -> None:
+        px_width = int(series.chart().plotArea().width())
+        if px_width > 0 and len(data) > 4 * px_width:
+            series.replace(_downsample_m4(list(reversed(data)), px_width))
+        else:
+            # Rewrite the preallocated points in place and hand them to Qt in
+            # one call instead of clearing the series and appending point by point.
+            for point, value in zip(points, reversed(data)):
+                point.setY(value)
+            series.replace(points[: len(data)])
+        # The range settles at the history length; re-setting it would still
+        # make QtCharts recompute ticks and relayout the axis every tick.
+        x_max = max(60, len(data))
+        if self._chart_x_max.get(series) != x_max:
+            axis_x = series.chart().axisX()
+            if axis_x:
+                axis_x.setRange(0, x_max)
+            self._chart_x_max[series] = x_max
+
+    def _scale_y_axis(self, series: QtChart.QLineSeries, stats: Tuple[float, float, float, float]) -> None:
+        # Unbounded series (bytes/s) get headroom above the peak; the range only
+        # moves when the peak does.
+        _, peak, _, _ = stats
+        y_max = max(peak, 1.0) * 1.1
+        if self._chart_y_max.get(series) != y_max:
+            axis_y = series.chart().axisY()
+            if axis_y:
+                axis_y.setRange(0, y_max)
+            self._chart_y_max[series] = y_max
+
+    def _update_disk_table(self, disk_metrics: Dict[str, DiskMetrics]) -> None:
+        self.disk_model.set_rows(list(disk_metrics.items()))
 
     def _update_process_table(self, processes: List[tuple[int, str, float]]) -> None:
-        self.process_table.setRowCount(len(processes))
-        for row, (pid, name, cpu_percent) in enumerate(processes):
-            for column, value in enumerate([pid, name, f"{cpu_percent:.2f}"]):
-                item = QtWidgets.QTableWidgetItem(str(value))
-                self.process_table.setItem(row, column, item)
-
-    def _update_network_table(self, connections: Iterable[tuple[str, str, str]]) -> None:
-        self.network_table.setRowCount(len(connections))
-        for row, (ctype, local, remote) in enumerate(connections):
-            for column, value in enumerate([ctype, local, remote]):
-                item = QtWidgets.QTableWidgetItem(str(value))
-                self.network_table.setItem(row, column, item)
+        self.process_model.set_rows(processes)
+
+    def _update_network_table(self, connections: List[Any]) -> None:
+        self.network_model.set_rows(connections)
 
     # ------------------ Optimization Actions ------------------
     def refresh_services(self) -> None:
+        # Listing units and checking disk space for the recommendations both
+        # block, so they run on the pool; the button stays off until they land.
+        self.refresh_services_btn.setEnabled(False)
+        self._run_task(self._load_services, "Service refresh", self._on_services_loaded, announce=False)
+
+    def _load_services(self) -> Tuple[List[ServiceInfo], List[str]]:
         services = self.service_manager.list_services()
-        self.service_table.setRowCount(len(services))
-        for row, service in enumerate(services):
-            self.service_table.setItem(row, 0, QtWidgets.QTableWidgetItem(service["name"]))
-            self.service_table.setItem(row, 1, QtWidgets.QTableWidgetItem(service["load"]))
-            self.service_table.setItem(row, 2, QtWidgets.QTableWidgetItem(service["active"]))
-            self.service_table.setItem(row, 3, QtWidgets.QTableWidgetItem(service["sub"]))
-
-            start_stop_widget = QtWidgets.QWidget()
-            start_stop_layout = QtWidgets.QHBoxLayout()
-            start_btn = QtWidgets.QPushButton("Start")
-            stop_btn = QtWidgets.QPushButton("Stop")
-            start_btn.clicked.connect(lambda _, name=service["name"]: self._service_action(name, "start"))
-            stop_btn.clicked.connect(lambda _, name=service["name"]: self._service_action(name, "stop"))
-            start_stop_layout.addWidget(start_btn)
-            start_stop_layout.addWidget(stop_btn)
-            start_stop_layout.setContentsMargins(0, 0, 0, 0)
-            start_stop_widget.setLayout(start_stop_layout)
-            self.service_table.setCellWidget(row, 4, start_stop_widget)
-
-            enable_disable_widget = QtWidgets.QWidget()
-            enable_disable_layout = QtWidgets.QHBoxLayout()
-            enable_btn = QtWidgets.QPushButton("Enable")
-            disable_btn = QtWidgets.QPushButton("Disable")
-            enable_btn.clicked.connect(lambda _, name=service["name"]: self._service_action(name, "enable"))
-            disable_btn.clicked.connect(lambda _, name=service["name"]: self._service_action(name, "disable"))
-            enable_disable_layout.addWidget(enable_btn)
-            enable_disable_layout.addWidget(disable_btn)
-            enable_disable_layout.setContentsMargins(0, 0, 0, 0)
-            enable_disable_widget.setLayout(enable_disable_layout)
-            self.service_table.setCellWidget(row, 5, enable_disable_widget)
-
-        self.refresh_recommendations()
+        return services, self.system_tuner.recommendations(services)
+
+    def _on_services_loaded(self, result: Optional[Tuple[List[ServiceInfo], List[str]]]) -> None:
+        self.refresh_services_btn.setEnabled(True)
+        if result is None:
+            self.statusBar().showMessage("Failed to refresh services", 2000)
+            return
+        services, recs = result
+        self.service_model.set_rows(services)
+        self.recommendations_list.clear()
+        self.recommendations_list.addItems(recs)
 
     def _service_action(self, service: str, action: str) -> None:
         mapping = {
@@ -441,7 +650,14 @@ class MainWindow(QtWidgets.QMainWindow):
             "disable": self.service_manager.disable_service,
         }
         fn = mapping[action]
-        if fn(service):
+        self._run_task(
+            functools.partial(fn, service),
+            f"{action.title()} {service}",
+            functools.partial(self._on_service_action_done, service, action),
+        )
+
+    def _on_service_action_done(self, service: str, action: str, success: Optional[bool]) -> None:
+        if success:
             self.statusBar().showMessage(f"{action.title()}ed {service}", 2000)
         else:
             self.statusBar().showMessage(f"Failed to {action} {service}", 2000)
@@ -450,7 +666,7 @@ class MainWindow(QtWidgets.QMainWindow):
     def update_cpu_governor_ui(self) -> None:
         current = self.cpu_tuner.current_governor() or "Unknown"
         self.current_governor_label.setText(f"Current: {current}")
-        if current and current not in [self.governor_combo.itemText(i) for i in range(self.governor_combo.count())]:
+        if current and self.governor_combo.findText(current) == -1:
             self.governor_combo.addItem(current)
 
     def change_governor(self, governor: str) -> None:
@@ -462,8 +678,11 @@ class MainWindow(QtWidgets.QMainWindow):
             self.statusBar().showMessage(f"Failed to set governor {governor}", 2000)
         self.update_cpu_governor_ui()
 
-    def update_swappiness_label(self, value: int) -> None:
-        self.swappiness_label.setText(str(value))
+    def schedule_swappiness_label(self, value: int) -> None:
+        self.swappiness_label_timer.start()
+
+    def update_swappiness_label(self) -> None:
+        self.swappiness_label.setText(str(self.swappiness_slider.value()))
 
     def apply_swappiness(self) -> None:
         value = self.swappiness_slider.value()
@@ -479,25 +698,31 @@ class MainWindow(QtWidgets.QMainWindow):
             self.statusBar().showMessage("Failed to clear cache", 2000)
 
     def clean_temp_files(self) -> None:
-        removed = self.disk_cleaner.clean_temp_files()
-        self.statusBar().showMessage(f"Removed {len(removed)} temporary entries", 2000)
+        self._run_task(self.disk_cleaner.clean_temp_files, "Temp file cleanup", self._on_temp_files_cleaned)
+
+    def _on_temp_files_cleaned(self, removed: Optional[List[Path]]) -> None:
+        if removed is None:
+            self.statusBar().showMessage("Failed to clean temporary files", 2000)
+        else:
+            self.statusBar().showMessage(f"Removed {len(removed)} temporary entries", 2000)
 
     def clean_package_cache(self) -> None:
-        if self.disk_cleaner.clean_package_cache():
+        self._run_task(self.disk_cleaner.clean_package_cache, "Package cache cleanup", self._on_package_cache_cleaned)
+
+    def _on_package_cache_cleaned(self, cleaned: Optional[bool]) -> None:
+        if cleaned:
             self.statusBar().showMessage("Cleaned package cache", 2000)
         else:
             self.statusBar().showMessage("Failed to clean package cache", 2000)
 
-    def refresh_recommendations(self) -> None:
-        services = self.service_manager.list_services()
-        recs = self.system_tuner.recommendations(services)
-        self.recommendations_list.clear()
-        for rec in recs:
-            self.recommendations_list.addItem(rec)
-
     def apply_recommendations(self) -> None:
-        services = self.service_manager.list_services()
-        results = self.system_tuner.apply_recommendations(services)
+        self._run_task(
+            lambda: self.system_tuner.apply_recommendations(self.service_manager.list_services()),
+            "Applying recommendations",
+            self._on_recommendations_applied,
+        )
+
+    def _on_recommendations_applied(self, results: Optional[List[str]]) -> None:
         if results:
             self.statusBar().showMessage("; ".join(results), 4000)
         else:
@@ -506,41 +731,172 @@ class MainWindow(QtWidgets.QMainWindow):
 
     # ------------------ File management ------------------
     def _selected_file_paths(self) -> List[Path]:
-        paths: List[Path] = []
-        for idx in self.file_table.selectionModel().selectedRows():
-            item = self.file_table.item(idx.row(), 0)
-            if item:
-                paths.append(Path(item.text()))
-        return paths
+        return [self.file_model.path_at(idx.row()) for idx in self.file_table.selectionModel().selectedRows()]
 
     def delete_selected_files(self) -> None:
         removed = delete_files(self._selected_file_paths())
         self.statusBar().showMessage(f"Deleted {len(removed)} files", 2000)
+        self._search_cache.clear()
         self.search_files()
 
     def search_files(self) -> None:
-        name = self.search_name_input.text()
-        extension = self.search_ext_input.text()
+        name = self.search_name_input.text().lower()
+        extension = self.search_ext_input.text().lower()
         min_size = self.search_size_input.value()
+        key = (name, extension, min_size)
+        # Searching again for the same thing is a request to rescan; only new,
+        # narrower queries are answered from the cache.
+        rerun = key == self._last_search
+        self._last_search = key
+        cached = None if rerun else self._refine_cached_search(name, extension, min_size)
+        if cached is not None:
+            self._populate_file_table(cached)
+            return
         searcher = FileSearch(Path.home())
-        results = searcher.search(name=name, extension=extension, min_size=min_size)
-        self._populate_file_table(results)
+        self._start_file_job(
+            functools.partial(searcher.search, name=name, extension=extension, min_size=min_size),
+            functools.partial(self._cache_search, key),
+        )
+
+    def _refine_cached_search(self, name: str, extension: str, min_size: int) -> Optional[List[FileInfo]]:
+        """Answer a search from a recent one whose criteria it only narrows, if there is one."""
+        now = time.monotonic()
+        for key in reversed(self._search_cache):
+            cached_name, cached_extension, cached_min_size = key
+            stamp, files = self._search_cache[key]
+            if now - stamp > SEARCH_CACHE_TTL:
+                continue
+            if cached_name in name and extension.endswith(cached_extension) and min_size >= cached_min_size:
+                self._search_cache.move_to_end(key)
+                return [
+                    info
+                    for info in files
+                    if name in info.path.name.lower() and info.path.name.lower().endswith(extension) and info.size >= min_size
+                ]
+        return None
+
+    def _cache_search(self, key: Tuple[str, str, int], files: List[FileInfo]) -> None:
+        self._search_cache[key] = (time.monotonic(), files)
+        self._search_cache.move_to_end(key)
+        while len(self._search_cache) > SEARCH_CACHE_SIZE:
+            self._search_cache.popitem(last=False)
 
     def scan_large_files(self) -> None:
         scanner = DiskScanner(Path.home())
-        results = scanner.scan()
-        self._populate_file_table(results)
+        self._start_file_job(scanner.scan)
+
+    def _start_file_job(
+        self, job: Callable[[], List[FileInfo]], on_results: Optional[Callable[[List[FileInfo]], None]] = None
+    ) -> None:
+        self.search_btn.setEnabled(False)
+        self.scan_btn.setEnabled(False)
+        self.file_progress.show()
+        worker = ScanWorker(job)
+        if on_results is not None:
+            worker.signals.finished.connect(on_results)
+        worker.signals.finished.connect(self._on_file_job_finished)
+        QtCore.QThreadPool.globalInstance().start(worker)
+
+    def _run_task(
+        self, task: Callable[[], Any], description: str, on_finished: Callable[[Any], None], announce: bool = True
+    ) -> None:
+        """Run a slow call on the thread pool and hand its result back on the GUI thread."""
+        if announce:
+            self.statusBar().showMessage(f"{description} running...")
+        worker = TaskWorker(task, description)
+        # Tasks clean caches, write reports and exports, so cached searches may
+        # list files that no longer exist or miss new ones.
+        worker.signals.finished.connect(lambda _result: self._search_cache.clear())
+        worker.signals.finished.connect(on_finished)
+        QtCore.QThreadPool.globalInstance().start(worker)
+
+    def _on_file_job_finished(self, files: List[FileInfo]) -> None:
+        self.search_btn.setEnabled(True)
+        self.scan_btn.setEnabled(True)
+        self.file_progress.hide()
+        self._populate_file_table(files)
 
     def _populate_file_table(self, files: List[FileInfo]) -> None:
-        self.file_table.setRowCount(len(files))
-        for row, info in enumerate(files):
-            self.file_table.setItem(row, 0, QtWidgets.QTableWidgetItem(str(info.path)))
-            self.file_table.setItem(row, 1, QtWidgets.QTableWidgetItem(str(info.size)))
+        # Large result sets are added a batch per event loop pass so the
+        # window keeps repainting while they load.
+        self._file_generation += 1
+        self.file_model.set_rows(files[:FILE_TABLE_BATCH])
+        if len(files) > FILE_TABLE_BATCH:
+            QtCore.QTimer.singleShot(
+                0, functools.partial(self._append_file_batch, files, FILE_TABLE_BATCH, self._file_generation)
+            )
+
+    def _append_file_batch(self, files: List[FileInfo], start: int, generation: int) -> None:
+        if generation != self._file_generation:
+            return  # a newer result replaced this one
+        self.file_model.append_rows(files[start : start + FILE_TABLE_BATCH])
+        if start + FILE_TABLE_BATCH < len(files):
+            QtCore.QTimer.singleShot(
+                0, functools.partial(self._append_file_batch, files, start + FILE_TABLE_BATCH, generation)
+            )
 
     # ------------------ Logs ------------------
     def refresh_logs(self) -> None:
-        entries = read_logs()
-        self.log_view.setPlainText("\n".join(entries))
+        """Show the newest lines of each log; older pages load on scrolling up."""
+        self._log_limit = LOG_PAGE_LINES
+        self._logs_exhausted = False
+        self._show_logs(read_logs(self._log_limit), distance_from_bottom=0)
+
+    def _show_logs(self, entries: List[str], distance_from_bottom: int) -> None:
+        self.log_entries = entries
+        self._log_entries_lower = None
+        self._log_filter = ""
+        self._log_line_count = len(entries)
+        self._render_logs(distance_from_bottom)
+
+    def _render_logs(self, distance_from_bottom: int) -> None:
+        needle = self.log_filter_input.text().lower()
+        if needle:
+            shown = [self.log_entries[index] for index in self._filter_log_indices(needle)]
+        else:
+            shown = self.log_entries
+        scrollbar = self.log_view.verticalScrollBar()
+        self._loading_logs = True
+        try:
+            self.log_view.setPlainText("\n".join(shown))
+            scrollbar.setValue(scrollbar.maximum() - distance_from_bottom)
+        finally:
+            self._loading_logs = False
+
+    def _filter_log_indices(self, needle: str) -> List[int]:
+        """Return the indices of the loaded entries containing `needle` (already lowercased)."""
+        if self._log_entries_lower is None:
+            self._log_entries_lower = [entry.lower() for entry in self.log_entries]
+        lower = self._log_entries_lower
+        # Typing more characters can only narrow the previous matches.
+        if self._log_filter and needle.startswith(self._log_filter):
+            candidates: Sequence[int] = self._log_matches
+        else:
+            candidates = range(len(lower))
+        self._log_matches = [index for index in candidates if needle in lower[index]]
+        self._log_filter = needle
+        return self._log_matches
+
+    def schedule_log_filter(self, text: str) -> None:
+        self.log_filter_timer.start()
+
+    def apply_log_filter(self) -> None:
+        self._render_logs(distance_from_bottom=0)
+
+    def _on_log_scrolled(self, value: int) -> None:
+        if value == 0 and not self._loading_logs and not self._logs_exhausted:
+            self._load_older_logs()
+
+    def _load_older_logs(self) -> None:
+        scrollbar = self.log_view.verticalScrollBar()
+        if scrollbar.maximum() == 0:
+            return
+        self._log_limit += LOG_PAGE_LINES
+        entries = read_logs(self._log_limit)
+        if len(entries) <= self._log_line_count:
+            self._logs_exhausted = True
+            return
+        self._show_logs(entries, distance_from_bottom=scrollbar.maximum() - scrollbar.value())
 
     def clear_logs(self) -> None:
         if clear_logs():
@@ -552,35 +908,50 @@ class MainWindow(QtWidgets.QMainWindow):
     def export_logs(self) -> None:
         destination, _ = QtWidgets.QFileDialog.getSaveFileName(self, "Export Logs", str(APP_DIR), "Text Files (*.txt)")
         if destination:
-            path = export_logs(Path(destination))
-            if path:
-                self.statusBar().showMessage(f"Logs exported to {path}", 2000)
-            else:
-                self.statusBar().showMessage("Failed to export logs", 2000)
+            self._run_task(functools.partial(export_logs, Path(destination)), "Log export", self._on_logs_exported)
+
+    def _on_logs_exported(self, path: Optional[Path]) -> None:
+        if path:
+            self.statusBar().showMessage(f"Logs exported to {path}", 2000)
+        else:
+            self.statusBar().showMessage("Failed to export logs", 2000)
 
     def generate_report(self) -> None:
-        path = generate_performance_report(self.monitor)
-        self.statusBar().showMessage(f"Report generated: {path}", 4000)
+        self._run_task(functools.partial(generate_performance_report, self.monitor), "Report generation", self._on_report_generated)
+
+    def _on_report_generated(self, path: Optional[Path]) -> None:
+        if path is None:
+            self.statusBar().showMessage("Failed to generate report", 2000)
+        else:
+            self.statusBar().showMessage(f"Report generated: {path}", 4000)
 
     # ------------------ Settings ------------------
-    def toggle_theme(self, state: int) -> None:
+    @staticmethod
+    def _build_dark_palette() -> QtGui.QPalette:
         palette = QtGui.QPalette()
-        if state == QtCore.Qt.Checked:
-            palette.setColor(QtGui.QPalette.Window, QtGui.QColor(53, 53, 53))
-            palette.setColor(QtGui.QPalette.WindowText, QtCore.Qt.white)
-            palette.setColor(QtGui.QPalette.Base, QtGui.QColor(25, 25, 25))
-            palette.setColor(QtGui.QPalette.AlternateBase, QtGui.QColor(53, 53, 53))
-            palette.setColor(QtGui.QPalette.ToolTipBase, QtCore.Qt.white)
-            palette.setColor(QtGui.QPalette.ToolTipText, QtCore.Qt.white)
-            palette.setColor(QtGui.QPalette.Text, QtCore.Qt.white)
-            palette.setColor(QtGui.QPalette.Button, QtGui.QColor(53, 53, 53))
-            palette.setColor(QtGui.QPalette.ButtonText, QtCore.Qt.white)
-            palette.setColor(QtGui.QPalette.BrightText, QtCore.Qt.red)
-            palette.setColor(QtGui.QPalette.Highlight, QtGui.QColor(142, 45, 197).lighter())
-            palette.setColor(QtGui.QPalette.HighlightedText, QtCore.Qt.black)
-        else:
-            palette = self.style().standardPalette()
-        self.setPalette(palette)
+        palette.setColor(QtGui.QPalette.Window, QtGui.QColor(53, 53, 53))
+        palette.setColor(QtGui.QPalette.WindowText, QtCore.Qt.white)
+        palette.setColor(QtGui.QPalette.Base, QtGui.QColor(25, 25, 25))
+        palette.setColor(QtGui.QPalette.AlternateBase, QtGui.QColor(53, 53, 53))
+        palette.setColor(QtGui.QPalette.ToolTipBase, QtCore.Qt.white)
+        palette.setColor(QtGui.QPalette.ToolTipText, QtCore.Qt.white)
+        palette.setColor(QtGui.QPalette.Text, QtCore.Qt.white)
+        palette.setColor(QtGui.QPalette.Button, QtGui.QColor(53, 53, 53))
+        palette.setColor(QtGui.QPalette.ButtonText, QtCore.Qt.white)
+        palette.setColor(QtGui.QPalette.BrightText, QtCore.Qt.red)
+        palette.setColor(QtGui.QPalette.Highlight, QtGui.QColor(142, 45, 197).lighter())
+        palette.setColor(QtGui.QPalette.HighlightedText, QtCore.Qt.black)
+        return palette
+
+    def toggle_theme(self, state: int) -> None:
+        self.setPalette(self._dark_palette if state == QtCore.Qt.Checked else self._light_palette)
+
+    def closeEvent(self, event: QtGui.QCloseEvent) -> None:
+        if self.monitor_thread.isRunning():
+            QtCore.QMetaObject.invokeMethod(self.monitor_worker, "stop", QtCore.Qt.BlockingQueuedConnection)
+            self.monitor_thread.quit()
+            self.monitor_thread.wait()
+        super().closeEvent(event)
 
     def save_schedule(self) -> None:
         self.schedule_config = {
@@ -602,7 +973,7 @@ class MainWindow(QtWidgets.QMainWindow):
 def main() -> None:
     app = QtWidgets.QApplication(sys.argv)
     window = MainWindow()
-    if window.dark_mode_checkbox.isChecked():
+    if window.schedule_config.get("dark_mode", False):
         window.toggle_theme(QtCore.Qt.Checked)
     window.show()
     sys.exit(app.exec_())
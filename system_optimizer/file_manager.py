@@ -2,18 +2,72 @@
 
 from __future__ import annotations
 
+import functools
 import heapq
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, Iterator, List, Tuple
+from typing import AnyStr, Iterable, Iterator, List, Tuple
 
 from .logging_config import get_logger
 
 file_logger = get_logger("File Management")
 
+SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+# Bounds the directory handles held open by concurrent walks.
+_SCANDIR_SLOTS = threading.BoundedSemaphore(512)
 
-@dataclass
+
+def _iter_file_entries(root: AnyStr) -> Iterator[os.DirEntry[AnyStr]]:
+    """Yield every regular file under `root`, depth first, without following symlinks.
+
+    Entry names and paths have the same type as `root`; bytes roots skip
+    decoding every file name.
+    """
+    stack = [root]
+    while stack:
+        files: List[os.DirEntry[AnyStr]] = []
+        # List the directory under the slot and yield only after releasing it,
+        # so a slow consumer never holds a slot (or an open handle).
+        with _SCANDIR_SLOTS:
+            try:
+                entries = os.scandir(stack.pop())
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            files.append(entry)
+                    except OSError:
+                        continue
+        yield from files
+
+
+def _split_top_level(root: AnyStr) -> Tuple[List[os.DirEntry[AnyStr]], List[AnyStr]]:
+    """Return the regular files and the subdirectory paths directly under `root`.
+
+    Raises OSError if `root` itself cannot be listed.
+    """
+    files: List[os.DirEntry[AnyStr]] = []
+    subdirs: List[AnyStr] = []
+    with os.scandir(root) as entries:
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    files.append(entry)
+            except OSError:
+                continue
+    return files, subdirs
+
+
+@dataclass(slots=True)
 class FileInfo:
     path: Path
     size: int
@@ -27,23 +81,45 @@ class DiskScanner:
         self.max_results = max_results
 
     def scan(self) -> List[FileInfo]:
-        heap: List[Tuple[int, Path]] = []
-        for path in self._walk_paths():
-            try:
-                size = path.stat().st_size
-            except (PermissionError, FileNotFoundError):
-                continue
-            heapq.heappush(heap, (size, path))
-            if len(heap) > self.max_results:
-                heapq.heappop(heap)
-        results = [FileInfo(path=p, size=s) for s, p in sorted(heap, reverse=True)]
+        # Each top-level directory is walked on its own thread; stat and
+        # readdir release the GIL, so the walks overlap.
+        # The walk runs on bytes paths so file names are never decoded; only
+        # the surviving top-N are turned back into Paths.
+        try:
+            files, subdirs = _split_top_level(os.fsencode(self.root))
+        except OSError as exc:
+            file_logger.error("Failed to scan %s: %s", self.root, exc)
+            return []
+        heap = self._largest(files)
+        with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as pool:
+            for partial in pool.map(self._scan_subtree, subdirs):
+                for item in partial:
+                    self._push(heap, item)
+        results = [FileInfo(path=Path(os.fsdecode(p)), size=s) for s, p in sorted(heap, reverse=True) if s >= 0]
         file_logger.info("Identified %d large files", len(results))
         return results
 
-    def _walk_paths(self) -> Iterator[Path]:
-        for dirpath, _, filenames in os.walk(self.root):
-            for filename in filenames:
-                yield Path(dirpath) / filename
+    def _scan_subtree(self, root: bytes) -> List[Tuple[int, bytes]]:
+        return self._largest(_iter_file_entries(root))
+
+    def _largest(self, entries: Iterable[os.DirEntry[bytes]]) -> List[Tuple[int, bytes]]:
+        # The heap starts full of (-1, b"") sentinels, so each candidate costs
+        # one comparison and at most one heappushpop.
+        heap: List[Tuple[int, bytes]] = [(-1, b"")] * self.max_results
+        if not heap:
+            return heap
+        for entry in entries:
+            try:
+                size = entry.stat(follow_symlinks=False).st_size
+            except OSError:
+                continue
+            if size > heap[0][0]:
+                heapq.heappushpop(heap, (size, entry.path))
+        return heap
+
+    def _push(self, heap: List[Tuple[int, bytes]], item: Tuple[int, bytes]) -> None:
+        if heap and item[0] > heap[0][0]:
+            heapq.heappushpop(heap, item)
 
 
 class FileSearch:
@@ -53,35 +129,53 @@ class FileSearch:
         self.root = root
 
     def search(self, name: str = "", extension: str = "", min_size: int = 0) -> List[FileInfo]:
+        # Top-level directories are searched in parallel, as in DiskScanner.scan.
+        name = name.lower()
+        extension = extension.lower()
+        try:
+            files, subdirs = _split_top_level(os.fspath(self.root))
+        except OSError as exc:
+            file_logger.error("Failed to search %s: %s", self.root, exc)
+            return []
+        matches = self._matches(files, name, extension, min_size)
+        search_subtree = functools.partial(self._search_subtree, name=name, extension=extension, min_size=min_size)
+        with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as pool:
+            for partial in pool.map(search_subtree, subdirs):
+                matches.extend(partial)
+        file_logger.info("Found %d files for search criteria", len(matches))
+        return matches
+
+    def _search_subtree(self, root: str, name: str, extension: str, min_size: int) -> List[FileInfo]:
+        return self._matches(_iter_file_entries(root), name, extension, min_size)
+
+    @staticmethod
+    def _matches(entries: Iterable[os.DirEntry[str]], name: str, extension: str, min_size: int) -> List[FileInfo]:
         matches: List[FileInfo] = []
-        for path in self._walk_paths():
-            if name and name.lower() not in path.name.lower():
+        for entry in entries:
+            # Cheap name checks first so rejected files never cost a stat().
+            entry_name = entry.name.lower()
+            if name and name not in entry_name:
                 continue
-            if extension and not path.name.lower().endswith(extension.lower()):
+            if extension and not entry_name.endswith(extension):
                 continue
             try:
-                size = path.stat().st_size
-            except (PermissionError, FileNotFoundError):
+                size = entry.stat(follow_symlinks=False).st_size
+            except OSError:
                 continue
             if size < min_size:
                 continue
-            matches.append(FileInfo(path=path, size=size))
-        file_logger.info("Found %d files for search criteria", len(matches))
+            matches.append(FileInfo(path=Path(entry.path), size=size))
         return matches
 
-    def _walk_paths(self) -> Iterator[Path]:
-        for dirpath, _, filenames in os.walk(self.root):
-            for filename in filenames:
-                yield Path(dirpath) / filename
-
 
 def delete_files(paths: Iterable[Path]) -> List[Path]:
     removed: List[Path] = []
     for path in paths:
         try:
-            path.unlink()
+            os.unlink(path)
             removed.append(path)
-            file_logger.info("Deleted file %s", path)
-        except (FileNotFoundError, PermissionError, OSError) as exc:
+            file_logger.debug("Deleted file %s", path)
+        except OSError as exc:
             file_logger.error("Failed to delete %s: %s", path, exc)
+    file_logger.info("Deleted %d files", len(removed))
     return removed
@@ -2,17 +2,26 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
+import logging.handlers
+import queue
+import time
 from pathlib import Path
 from typing import Optional
 
 LOG_FORMAT = "{timestamp} - {log_level} - {component} - {message}"
+# Positional form of LOG_FORMAT, cheaper to fill in per record.
+_LOG_TEMPLATE = "%s - %s - %s - %s"
 
 APP_DIR = Path.home() / ".system_optimizer"
 APP_DIR.mkdir(parents=True, exist_ok=True)
 LOG_FILE = APP_DIR / "system_optimizer.log"
 
 
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
 class ComponentLogger(logging.LoggerAdapter):
     """Logger adapter that injects the component name into the log record."""
 
@@ -29,16 +38,20 @@ def configure_logging(level: int = logging.INFO) -> None:
     """Configure application-wide logging with the mandated format."""
 
     class ComponentFormatter(logging.Formatter):
+        _last_second = -1
+        _last_stamp = ""
+
         def format(self, record: logging.LogRecord) -> str:
-            timestamp = self.formatTime(record, self.datefmt)
-            message = record.getMessage()
+            # strftime only runs once per second; the milliseconds are appended per record.
+            second = int(record.created)
+            if second != self._last_second:
+                self._last_second = second
+                self._last_stamp = time.strftime("%Y-%m-%d %H:%M:%S", self.converter(record.created))
+            timestamp = "%s,%03d" % (self._last_stamp, record.msecs)
             component = getattr(record, "component", record.name)
-            return LOG_FORMAT.format(
-                timestamp=timestamp,
-                log_level=record.levelname,
-                component=component,
-                message=message,
-            )
+            return _LOG_TEMPLATE % (timestamp, record.levelname, component, record.getMessage())
+
+    global _listener
 
     handler = logging.StreamHandler()
     handler.setFormatter(ComponentFormatter())
@@ -52,9 +65,26 @@ def configure_logging(level: int = logging.INFO) -> None:
     # Clear default handlers to avoid duplicate logs when running multiple times.
     if root_logger.handlers:
         root_logger.handlers.clear()
-
-    root_logger.addHandler(handler)
-    root_logger.addHandler(file_handler)
+    if _listener is not None:
+        _stop_listener()
+    else:
+        atexit.register(_stop_listener)
+
+    # Callers only enqueue records; formatting and the console/file writes
+    # happen on the listener's background thread.
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    root_logger.addHandler(logging.handlers.QueueHandler(records))
+    _listener = logging.handlers.QueueListener(records, handler, file_handler, respect_handler_level=True)
+    _listener.start()
+
+
+def _stop_listener() -> None:
+    """Flush queued records and close the handlers behind the queue."""
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
 
 
 def get_logger(component: str, level: Optional[int] = None) -> ComponentLogger:
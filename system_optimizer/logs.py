@@ -2,39 +2,125 @@ from __future__ import annotations
 
 import datetime as dt
 import json
+import mmap
+import os
+from dataclasses import asdict
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to the stdlib encoder
+    orjson = None
 
 from .logging_config import APP_DIR, get_logger
-from .monitor import SystemMonitor
+from .monitor import SystemMonitor, format_connection
 
 log_logger = get_logger("Logs")
 
+APP_LOG = APP_DIR / "system_optimizer.log"
 LOG_FILES = [
     Path("/var/log/syslog"),
     Path("/var/log/messages"),
     Path("/var/log/dmesg"),
-    APP_DIR / "system_optimizer.log",
+    APP_LOG,
 ]
 
 REPORTS_DIR = Path.home() / ".system_optimizer" / "reports"
-REPORTS_DIR.mkdir(parents=True, exist_ok=True)
-
-
-def read_logs(limit: int = 1000) -> List[str]:
-    entries: List[str] = []
+_reports_dir_ready = False
+
+TAIL_CHUNK_SIZE = 64 * 1024
+MMAP_TAIL_THRESHOLD = 1 << 20
+# Lines taken from the end of each log file for a performance report.
+REPORT_LOG_LINES = 50
+
+NO_LOG_ENTRIES = "No log entries available. Try generating a report or waiting for new events."
+
+# Last tail read per file: ((size, mtime_ns, inode), line limit, lines).
+_tail_cache: Dict[Path, Tuple[Tuple[int, int, int], int, List[str]]] = {}
+
+
+def tail_log(log_file: Path, limit: int) -> Iterator[str]:
+    """Yield the last `limit` lines of `log_file`, reading backwards from the end."""
+    chunks: List[bytes] = []
+    newlines = 0
+    with open(log_file, "rb") as handle:
+        pos = handle.seek(0, os.SEEK_END)
+        if pos > MMAP_TAIL_THRESHOLD:
+            yield from _mmap_tail_lines(handle.fileno(), limit)
+            return
+        while pos > 0 and newlines <= limit:
+            step = min(TAIL_CHUNK_SIZE, pos)
+            pos -= step
+            handle.seek(pos)
+            chunk = handle.read(step)
+            chunks.append(chunk)
+            newlines += chunk.count(b"\n")
+    data = b"".join(reversed(chunks))
+    if pos > 0:
+        # Drop the partial line we started reading in the middle of.
+        data = data[data.index(b"\n") + 1 :]
+    yield from data.decode(errors="ignore").splitlines()[-limit:]
+
+
+def _mmap_tail_lines(fd: int, limit: int) -> List[str]:
+    """Tail a large file through a read-only mapping so only its last pages are faulted in."""
+    with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mapped:
+        end = len(mapped)
+        # A trailing newline terminates the last line rather than starting a new one.
+        pos = end - 1 if mapped[end - 1 : end] == b"\n" else end
+        for _ in range(limit):
+            pos = mapped.rfind(b"\n", 0, pos)
+            if pos == -1:
+                break
+        data = mapped[pos + 1 : end]
+    return data.decode(errors="ignore").splitlines()[-limit:]
+
+
+def _cached_tail(log_file: Path, stat: os.stat_result, limit: int) -> List[str]:
+    """Return the last `limit` lines of `log_file`, reusing the previous read while `stat` is unchanged."""
+    if log_file == APP_LOG:
+        # Our own log grows with every read and report; caching it never hits.
+        return list(tail_log(log_file, limit))
+    version = (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+    cached = _tail_cache.get(log_file)
+    if cached is not None and cached[0] == version and cached[1] >= limit:
+        return cached[2][-limit:]
+    lines = list(tail_log(log_file, limit))
+    _tail_cache[log_file] = (version, limit, lines)
+    return lines
+
+
+def _iter_log_entries(limit: int) -> Iterator[str]:
     for log_file in LOG_FILES:
-        if not log_file.exists():
+        # One stat serves both the missing/empty check and the tail cache key.
+        try:
+            stat = os.stat(log_file)
+        except OSError:
+            _tail_cache.pop(log_file, None)
+            continue
+        if not stat.st_size:
             continue
         try:
-            lines = log_file.read_text(errors="ignore").splitlines()
+            lines = _cached_tail(log_file, stat, limit)
+        except FileNotFoundError:
+            # Rotated away between the stat and the open; skip it this time.
+            _tail_cache.pop(log_file, None)
+            continue
         except PermissionError as exc:
             log_logger.error("Permission denied reading %s: %s", log_file, exc)
-            entries.append(f"Permission denied reading {log_file}: {exc}")
+            yield f"Permission denied reading {log_file}: {exc}"
+            continue
+        except OSError as exc:
+            log_logger.error("Failed to read %s: %s", log_file, exc)
             continue
-        entries.extend(lines[-limit:])
+        yield from lines
+
+
+def read_logs(limit: int = 1000) -> List[str]:
+    entries = list(_iter_log_entries(limit))
     if not entries:
-        entries.append("No log entries available. Try generating a report or waiting for new events.")
+        entries.append(NO_LOG_ENTRIES)
     log_logger.info("Loaded %d log entries", len(entries))
     return entries
 
@@ -42,20 +128,31 @@ def read_logs(limit: int = 1000) -> List[str]:
 def clear_logs() -> bool:
     success = True
     for log_file in LOG_FILES:
-        if not log_file.exists():
-            continue
         try:
-            log_file.write_text("")
-            log_logger.info("Cleared log file %s", log_file)
-        except PermissionError as exc:
+            os.truncate(log_file, 0)
+        except FileNotFoundError:
+            continue
+        except OSError as exc:
             log_logger.error("Failed to clear %s: %s", log_file, exc)
             success = False
+        else:
+            _tail_cache.pop(log_file, None)
+            log_logger.info("Cleared log file %s", log_file)
     return success
 
 
-def export_logs(destination: Path) -> Optional[Path]:
+def export_logs(destination: Path, limit: int = 1000) -> Optional[Path]:
     try:
-        destination.write_text("\n".join(read_logs()))
+        # Stream lines straight from the log tails into the file.
+        with destination.open("w", encoding="utf-8", errors="ignore", buffering=1 << 20) as out:
+            written = False
+            for line in _iter_log_entries(limit):
+                out.write(line)
+                out.write("\n")
+                written = True
+            if not written:
+                out.write(NO_LOG_ENTRIES)
+                out.write("\n")
         log_logger.info("Exported logs to %s", destination)
         return destination
     except PermissionError as exc:
@@ -63,16 +160,30 @@ def export_logs(destination: Path) -> Optional[Path]:
         return None
 
 
+def _reports_dir() -> Path:
+    """Create the reports directory on first use rather than at import time."""
+    global _reports_dir_ready
+    if not _reports_dir_ready:
+        REPORTS_DIR.mkdir(parents=True, exist_ok=True)
+        _reports_dir_ready = True
+    return REPORTS_DIR
+
+
+def _dump_report(report: Dict[str, object]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(report, indent=2).encode()
+
+
 def generate_performance_report(monitor: SystemMonitor) -> Path:
     timestamp = dt.datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = REPORTS_DIR / f"performance_report_{timestamp}.json"
+    filename = _reports_dir() / f"performance_report_{timestamp}.json"
 
     try:
-        cpu = monitor.cpu_metrics()
-        mem = monitor.memory_metrics()
-        disk = monitor.disk_metrics()
-        net = monitor.network_metrics()
-        procs = monitor.running_processes(50)
+        # Report on what the dashboard collector last saw instead of sampling
+        # again from this thread.
+        snapshot = monitor.latest_snapshot()
+        cpu, mem, disk, net = snapshot.cpu, snapshot.memory, snapshot.disk, snapshot.network
 
         report: Dict[str, object] = {
             "generated_at": dt.datetime.now().isoformat(),
@@ -84,13 +195,17 @@ def generate_performance_report(monitor: SystemMonitor) -> Path:
                 "percent": mem.percent,
                 "swap": {"total": mem.swap_total, "used": mem.swap_used, "free": mem.swap_free, "percent": mem.swap_percent},
             },
-            "disk": {k: v.__dict__ for k, v in disk.items()},
-            "network": {"bytes_sent": net.bytes_sent, "bytes_recv": net.bytes_recv, "connections": net.connections},
-            "top_processes": [{"pid": p[0], "name": p[1], "cpu_percent": p[2]} for p in procs],
-            "logs_sample": read_logs(200),
+            "disk": {k: asdict(v) for k, v in disk.items()},
+            "network": {
+                "bytes_sent": net.bytes_sent,
+                "bytes_recv": net.bytes_recv,
+                "connections": [format_connection(conn) for conn in net.connections],
+            },
+            "top_processes": [{"pid": p[0], "name": p[1], "cpu_percent": p[2]} for p in snapshot.top_processes],
+            "logs_sample": read_logs(REPORT_LOG_LINES),
         }
 
-        filename.write_text(json.dumps(report, indent=2))
+        filename.write_bytes(_dump_report(report))
         log_logger.info("Generated performance report %s", filename)
         return filename
     except Exception as exc:
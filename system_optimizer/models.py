@@ -0,0 +1,142 @@
+"""Qt item models backing the System Optimizer tables."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, List, Optional, Sequence, Tuple
+
+from PyQt5 import QtCore
+
+from .file_manager import FileInfo
+from .monitor import DiskMetrics, format_connection
+from .optimizer import ServiceInfo
+
+INV_GB = 1.0 / (1024 ** 3)
+
+
+class RowTableModel(QtCore.QAbstractTableModel):
+    """Read-only table model serving display text from a plain list of rows.
+
+    Rows are stored as-is and only formatted when a view asks for a visible
+    cell. Refreshing a table inserts or removes rows at the end and marks the
+    rows that differ as changed, so views only relayout and repaint what moved.
+    Models with `INCREMENTAL = False` reset instead, because a new result set
+    must not inherit the previous one's selection by row number.
+    """
+
+    HEADERS: Sequence[str] = ()
+    INCREMENTAL = True
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None) -> None:
+        super().__init__(parent)
+        self._rows: List[Any] = []
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section: int, orientation: QtCore.Qt.Orientation, role: int = QtCore.Qt.DisplayRole) -> Any:
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.DisplayRole) -> Any:
+        if role != QtCore.Qt.DisplayRole or not index.isValid():
+            return None
+        return self.display(self._rows[index.row()], index.column())
+
+    def display(self, row: Any, column: int) -> str:
+        return str(row[column])
+
+    def set_rows(self, rows: List[Any]) -> None:
+        # Most dashboard ticks change nothing; skip the signals and the repaint they trigger.
+        old = self._rows
+        if rows == old:
+            return
+        if not self.INCREMENTAL:
+            self.beginResetModel()
+            self._rows = rows
+            self.endResetModel()
+            return
+        common = min(len(old), len(rows))
+        changed = [row for row in range(common) if rows[row] != old[row]]
+        # Only the rows being removed or inserted may change inside the bracket;
+        # the surviving rows are updated afterwards and reported via dataChanged.
+        if len(rows) < len(old):
+            self.beginRemoveRows(QtCore.QModelIndex(), len(rows), len(old) - 1)
+            self._rows = old[: len(rows)]
+            self.endRemoveRows()
+        elif len(rows) > len(old):
+            self.beginInsertRows(QtCore.QModelIndex(), len(old), len(rows) - 1)
+            self._rows = old + rows[len(old) :]
+            self.endInsertRows()
+        self._rows = rows
+        if changed:
+            self.dataChanged.emit(
+                self.index(changed[0], 0),
+                self.index(changed[-1], len(self.HEADERS) - 1),
+                [QtCore.Qt.DisplayRole],
+            )
+
+    def append_rows(self, rows: List[Any]) -> None:
+        if not rows:
+            return
+        self.beginInsertRows(QtCore.QModelIndex(), len(self._rows), len(self._rows) + len(rows) - 1)
+        self._rows = self._rows + rows
+        self.endInsertRows()
+
+
+class ProcessModel(RowTableModel):
+    HEADERS = ("PID", "Process", "CPU %")
+
+    def display(self, row: Tuple[int, str, float], column: int) -> str:
+        if column == 2:
+            return f"{row[2]:.2f}"
+        return str(row[column])
+
+
+class DiskModel(RowTableModel):
+    HEADERS = ("Mount", "Used (GB)", "Free (GB)", "Usage %", "R/W (bytes)")
+
+    def display(self, row: Tuple[str, DiskMetrics], column: int) -> str:
+        mount, metrics = row
+        if column == 0:
+            return mount
+        if column == 1:
+            return f"{metrics.used * INV_GB:.2f}"
+        if column == 2:
+            return f"{metrics.free * INV_GB:.2f}"
+        if column == 3:
+            return f"{metrics.percent:.2f}"
+        return f"{metrics.read_bytes}/{metrics.write_bytes}"
+
+
+class NetworkModel(RowTableModel):
+    HEADERS = ("Type", "Local", "Remote/Status")
+
+    def display(self, row: Any, column: int) -> str:
+        return format_connection(row)[column]
+
+
+class ServiceModel(RowTableModel):
+    HEADERS = ("Service", "Load", "Active", "Sub", "Start/Stop", "Enable/Disable")
+    INCREMENTAL = False
+    KEYS = ("name", "load", "active", "sub")
+
+    def display(self, row: ServiceInfo, column: int) -> str:
+        if column < len(self.KEYS):
+            return getattr(row, self.KEYS[column])
+        return ""
+
+
+class FileModel(RowTableModel):
+    HEADERS = ("Path", "Size (bytes)")
+    INCREMENTAL = False
+
+    def display(self, row: FileInfo, column: int) -> str:
+        return str(row.path) if column == 0 else str(row.size)
+
+    def path_at(self, row: int) -> Path:
+        return self._rows[row].path
@@ -2,25 +2,33 @@
 
 from __future__ import annotations
 
+import heapq
 import os
+import sys
+import threading
+import time
+from array import array
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
+
 import psutil
-from collections import deque
 from dataclasses import dataclass, field
-from typing import Deque, Dict, Iterable, List, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from .logging_config import get_logger
 
 logger = get_logger("CPU")
 
 
-@dataclass
+@dataclass(slots=True)
 class CpuMetrics:
     total: float
     per_core: List[float]
     temperature: float | None
 
 
-@dataclass
+@dataclass(slots=True)
 class MemoryMetrics:
     total: int
     used: int
@@ -32,7 +40,7 @@ class MemoryMetrics:
     swap_percent: float
 
 
-@dataclass
+@dataclass(slots=True)
 class DiskMetrics:
     total: int
     used: int
@@ -42,91 +50,305 @@ class DiskMetrics:
     write_bytes: int
 
 
-@dataclass
+@dataclass(slots=True)
 class NetworkMetrics:
     bytes_sent: int
     bytes_recv: int
-    connections: List[Tuple[str, str, str]]
+    # Raw psutil connection rows; see `format_connection`.
+    connections: List[Any]
+
+
+def _busy_and_total(times: Any) -> Tuple[float, float]:
+    """Split a `cpu_times()` row into busy and total time the way `psutil.cpu_percent` does."""
+    total = sum(times) - getattr(times, "guest", 0) - getattr(times, "guest_nice", 0)
+    return total - times.idle - getattr(times, "iowait", 0), total
+
+
+def _percent(busy: float, total: float) -> float:
+    if total <= 0:
+        return 0.0
+    return round(min(max(busy / total * 100, 0.0), 100.0), 1)
+
+
+@lru_cache(maxsize=8)
+def _socket_type_name(kind: Any) -> str:
+    # Only a handful of socket kinds exist, so this is a dict hit after warmup.
+    return kind.name if hasattr(kind, "name") else str(kind)
+
+
+def format_connection(conn: Any) -> Tuple[str, str, str]:
+    """Render a psutil connection as (type, local address, remote address or status)."""
+    kind = _socket_type_name(conn.type)
+    laddr = f"{conn.laddr.ip}:{conn.laddr.port}" if conn.laddr else ""
+    raddr = f"{conn.raddr.ip}:{conn.raddr.port}" if conn.raddr else ""
+    return kind, laddr, raddr or conn.status
+
+
+class _PsutilReaders:
+    """Portable counter readers; `_linux_fast` provides the same functions on Linux."""
+
+    @staticmethod
+    def cpu_times() -> List[Tuple[float, float]]:
+        return [_busy_and_total(times) for times in psutil.cpu_times(percpu=True)]
+
+    @staticmethod
+    def memory() -> Tuple[int, int, int, float, int, int, int, float]:
+        vm = psutil.virtual_memory()
+        sm = psutil.swap_memory()
+        return vm.total, vm.used, vm.available, vm.percent, sm.total, sm.used, sm.free, sm.percent
 
+    @staticmethod
+    def disk_io_per_device() -> Dict[str, Tuple[int, int]]:
+        return {
+            device: (counters.read_bytes, counters.write_bytes)
+            for device, counters in psutil.disk_io_counters(perdisk=True).items()
+        }
 
-@dataclass
+    @staticmethod
+    def net_io() -> Tuple[int, int]:
+        counters = psutil.net_io_counters()
+        return counters.bytes_sent, counters.bytes_recv
+
+
+def _select_readers() -> Any:
+    if sys.platform.startswith("linux"):
+        from . import _linux_fast
+
+        try:
+            _linux_fast.cpu_times()
+            _linux_fast.memory()
+            _linux_fast.disk_io_per_device()
+            _linux_fast.net_io()
+        except (OSError, KeyError, ValueError, IndexError) as exc:
+            logger.warning("Falling back to psutil readers: %s", exc)
+        else:
+            return _linux_fast
+    return _PsutilReaders
+
+
+@dataclass(slots=True)
+class MonitorSnapshot:
+    """Metrics gathered in a single sampling pass.
+
+    `processes` is `None` when the pass skipped the process table;
+    `top_processes` always holds the most recently sampled table (empty until
+    the first one), so readers never have to walk /proc themselves. The
+    `*_history` arrays are private copies of the chart histories, oldest
+    sample first, so the GUI can read them while the collector keeps appending.
+    `network_stats` is `HistoricalSeries.stats()` of the network history,
+    taken in the same pass, for autoscaling its chart.
+    """
+
+    cpu: CpuMetrics
+    memory: MemoryMetrics
+    disk: Dict[str, DiskMetrics]
+    network: NetworkMetrics
+    processes: Optional[List[Tuple[int, str, float]]]
+    top_processes: List[Tuple[int, str, float]]
+    cpu_history: array
+    memory_history: array
+    network_history: array
+    network_stats: Tuple[float, float, float, float]
+
+
+@dataclass(slots=True)
 class HistoricalSeries:
-    """Maintain a fixed length history of metrics for charting."""
+    """Maintain a fixed length history of metrics for charting.
+
+    Samples live unboxed in a preallocated ring buffer; `_head` is the slot the
+    next sample is written to.
+    """
 
     maxlen: int
-    values: Deque[float] = field(init=False)
+    _buffer: array = field(init=False, repr=False)
+    _head: int = field(init=False, default=0, repr=False)
+    _length: int = field(init=False, default=0, repr=False)
 
     def __post_init__(self) -> None:
-        self.values = deque(maxlen=self.maxlen)
+        self._buffer = array("d", bytes(8 * self.maxlen))
 
     def append(self, value: float) -> None:
-        self.values.append(value)
+        self._buffer[self._head] = value
+        self._head = (self._head + 1) % self.maxlen
+        if self._length < self.maxlen:
+            self._length += 1
+
+    @property
+    def values(self) -> List[float]:
+        return list(self)
+
+    def __iter__(self) -> Iterator[float]:
+        # Until the buffer wraps, `_head == _length` and the first slice is empty.
+        return chain(self._buffer[self._head : self._length], self._buffer[: self._head])
+
+    def __len__(self) -> int:
+        return self._length
 
-    def __iter__(self) -> Iterable[float]:
-        return iter(self.values)
+    def to_array(self) -> array:
+        """Return a copy of the stored samples, oldest first."""
+        return self._buffer[self._head : self._length] + self._buffer[: self._head]
+
+    def stats(self) -> Tuple[float, float, float, float]:
+        """Return (min, max, mean, last) of the stored samples, or zeros when empty."""
+        if not self._length:
+            return 0.0, 0.0, 0.0, 0.0
+        # The stored slots are contiguous from 0 whether or not the buffer has wrapped.
+        samples = self._buffer[: self._length]
+        return min(samples), max(samples), sum(samples) / self._length, self._buffer[self._head - 1]
 
 
 class SystemMonitor:
-    """Collect system metrics using psutil."""
+    """Collect system metrics using psutil.
+
+    A single collector (the dashboard's `MonitorWorker`) calls `snapshot` on a
+    timer. The `*_metrics` getters hand out the last published snapshot, so
+    other readers such as report generation never touch /proc themselves or
+    disturb the collector's counter deltas.
+    """
 
-    def __init__(self, history_size: int = 60) -> None:
+    # net_connections() walks every process's fd table, so it is refreshed far
+    # less often than the byte counters.
+    CONNECTIONS_TTL = 5.0
+    # Mounts change rarely; re-reading /proc/mounts every tick is wasted work.
+    PARTITIONS_TTL = 30.0
+    # Free space moves slowly enough that a statvfs per mount per tick is overkill.
+    DISK_USAGE_TTL = 2.0
+
+    def __init__(self, history_size: int = 60, connection_kind: str = "tcp") -> None:
         self.cpu_history = HistoricalSeries(history_size)
         self.memory_history = HistoricalSeries(history_size)
         self.network_history = HistoricalSeries(history_size)
-        self._prev_disk_io = psutil.disk_io_counters()
-        self._prev_net_io = psutil.net_io_counters()
+        self._readers = _select_readers()
+        self._prev_disk_io = self._readers.disk_io_per_device()
+        self._prev_net_io = self._readers.net_io()
+        self._prev_cpu_times = self._readers.cpu_times()
+        # psutil `kind` filter for the connection table; "inet" adds UDP sockets.
+        self.connection_kind = connection_kind
+        self._connections: List[Any] = []
+        self._connections_ts = float("-inf")
+        self._partitions: List[Any] = []
+        self._partitions_ts = float("-inf")
+        # Mount point -> kernel device name as it appears in the IO counters.
+        self._partition_devices: Dict[str, str] = {}
+        self._disk_usage: Dict[str, Tuple[float, Any]] = {}
+        # None until the first temperature read tells us whether sensors work here.
+        self._temp_supported: Optional[bool] = None
+        self._temp_sensor: Optional[str] = None
+        # Serializes sampling; publishing `_latest` is a single reference swap,
+        # so readers never need the lock.
+        self._sample_lock = threading.Lock()
+        self._latest: Optional[MonitorSnapshot] = None
+        self._processes_primed = False
+
+    def snapshot(self, process_limit: Optional[int] = None) -> MonitorSnapshot:
+        """Sample every metric in one pass, reading each IO counter exactly once.
+
+        The process table is skipped when `process_limit` is `None`.
+        """
+        with self._sample_lock:
+            disk_io = self._readers.disk_io_per_device()
+            net_io = self._readers.net_io()
+            processes = self.running_processes(process_limit) if process_limit is not None else None
+            if processes is not None:
+                top_processes = processes
+            else:
+                top_processes = self._latest.top_processes if self._latest is not None else []
+            snapshot = MonitorSnapshot(
+                cpu=self._sample_cpu(),
+                memory=self._sample_memory(),
+                disk=self._build_disk_metrics(disk_io),
+                network=self._build_network_metrics(net_io),
+                processes=processes,
+                top_processes=top_processes,
+                cpu_history=self.cpu_history.to_array(),
+                memory_history=self.memory_history.to_array(),
+                network_history=self.network_history.to_array(),
+                network_stats=self.network_history.stats(),
+            )
+            self._latest = snapshot
+        return snapshot
+
+    def latest_snapshot(self) -> MonitorSnapshot:
+        """Return the last published snapshot, sampling once if there is none yet."""
+        snapshot = self._latest
+        if snapshot is None:
+            snapshot = self.snapshot()
+        return snapshot
 
     def cpu_metrics(self) -> CpuMetrics:
-        total = psutil.cpu_percent(interval=None)
-        per_core = psutil.cpu_percent(interval=None, percpu=True)
+        return self.latest_snapshot().cpu
+
+    def memory_metrics(self) -> MemoryMetrics:
+        return self.latest_snapshot().memory
+
+    def disk_metrics(self) -> Dict[str, DiskMetrics]:
+        return self.latest_snapshot().disk
+
+    def network_metrics(self) -> NetworkMetrics:
+        return self.latest_snapshot().network
+
+    def _sample_cpu(self) -> CpuMetrics:
+        # One /proc/stat read per tick: per-core usage comes from our own
+        # cpu_times deltas and the total is their time-weighted sum.
+        current = self._readers.cpu_times()
+        per_core: List[float] = []
+        busy_sum = total_sum = 0.0
+        for (busy, total), (prev_busy, prev_total) in zip(current, self._prev_cpu_times):
+            busy_delta = busy - prev_busy
+            total_delta = total - prev_total
+            per_core.append(_percent(busy_delta, total_delta))
+            busy_sum += busy_delta
+            total_sum += total_delta
+        self._prev_cpu_times = current
+        total = _percent(busy_sum, total_sum)
         temperature = self._read_cpu_temperature()
         self.cpu_history.append(total)
         logger.info("Updated CPU usage to %.2f%%", total)
         return CpuMetrics(total=total, per_core=per_core, temperature=temperature)
 
     def _read_cpu_temperature(self) -> float | None:
+        if self._temp_supported is False:
+            return None
         try:
             temps = psutil.sensors_temperatures()
         except (AttributeError, NotImplementedError):
             logger.warning("CPU temperature reading not supported on this platform")
+            self._temp_supported = False
             return None
+        self._temp_supported = True
         if not temps:
             return None
-        for entries in temps.values():
+        if self._temp_sensor in temps:
+            for entry in temps[self._temp_sensor]:
+                if entry.current is not None:
+                    return float(entry.current)
+        for sensor, entries in temps.items():
             for entry in entries:
                 if entry.current is not None:
+                    self._temp_sensor = sensor
                     return float(entry.current)
         return None
 
-    def memory_metrics(self) -> MemoryMetrics:
-        vm = psutil.virtual_memory()
-        sm = psutil.swap_memory()
-        self.memory_history.append(vm.percent)
-        return MemoryMetrics(
-            total=vm.total,
-            used=vm.used,
-            free=vm.available,
-            percent=vm.percent,
-            swap_total=sm.total,
-            swap_used=sm.used,
-            swap_free=sm.free,
-            swap_percent=sm.percent,
-        )
+    def _sample_memory(self) -> MemoryMetrics:
+        memory = MemoryMetrics(*self._readers.memory())
+        self.memory_history.append(memory.percent)
+        return memory
 
-    def disk_metrics(self) -> Dict[str, DiskMetrics]:
+    def _build_disk_metrics(self, current_io: Dict[str, Tuple[int, int]]) -> Dict[str, DiskMetrics]:
+        previous_io = self._prev_disk_io
+        self._prev_disk_io = current_io
         metrics: Dict[str, DiskMetrics] = {}
-        for part in psutil.disk_partitions():
-            if os.name == "nt":
-                if "cdrom" in part.opts or part.fstype == "":
-                    continue
-            try:
-                usage = psutil.disk_usage(part.mountpoint)
-            except PermissionError:
+        for part in self._cached_partitions():
+            usage = self._cached_disk_usage(part.mountpoint)
+            if usage is None:
                 continue
-        
-            current_io = psutil.disk_io_counters()
-            read_bytes = current_io.read_bytes - self._prev_disk_io.read_bytes
-            write_bytes = current_io.write_bytes - self._prev_disk_io.write_bytes
+            # Virtual filesystems (tmpfs, overlay, ...) have no block device to attribute IO to.
+            device = self._partition_devices.get(part.mountpoint, "")
+            current, previous = current_io.get(device), previous_io.get(device)
+            if current is not None and previous is not None:
+                read_bytes, write_bytes = current[0] - previous[0], current[1] - previous[1]
+            else:
+                read_bytes = write_bytes = 0
             metrics[part.mountpoint] = DiskMetrics(
                 total=usage.total,
                 used=usage.used,
@@ -135,31 +357,72 @@ class SystemMonitor:
                 read_bytes=read_bytes,
                 write_bytes=write_bytes,
             )
-        self._prev_disk_io = psutil.disk_io_counters()
         return metrics
 
-    def network_metrics(self) -> NetworkMetrics:
-        current_io = psutil.net_io_counters()
-        sent = current_io.bytes_sent - self._prev_net_io.bytes_sent
-        recv = current_io.bytes_recv - self._prev_net_io.bytes_recv
+    def _cached_disk_usage(self, mountpoint: str) -> Any:
+        now = time.monotonic()
+        cached = self._disk_usage.get(mountpoint)
+        if cached is not None and now - cached[0] < self.DISK_USAGE_TTL:
+            return cached[1]
+        try:
+            usage = psutil.disk_usage(mountpoint)
+        except PermissionError:
+            return None
+        self._disk_usage[mountpoint] = (now, usage)
+        return usage
+
+    def _cached_partitions(self) -> List[Any]:
+        now = time.monotonic()
+        if now - self._partitions_ts < self.PARTITIONS_TTL:
+            return self._partitions
+        partitions = psutil.disk_partitions()
+        if os.name == "nt":
+            # Match whole mount options once per refresh rather than substrings every tick.
+            partitions = [
+                part for part in partitions if part.fstype != "" and "cdrom" not in frozenset(part.opts.split(","))
+            ]
+        # Resolve symlinks such as /dev/mapper/root -> /dev/dm-0 once per refresh.
+        self._partition_devices = {
+            part.mountpoint: os.path.basename(os.path.realpath(part.device)) for part in partitions
+        }
+        self._partitions = partitions
+        self._partitions_ts = now
+        return partitions
+
+    def _build_network_metrics(self, current_io: Tuple[int, int]) -> NetworkMetrics:
+        sent = current_io[0] - self._prev_net_io[0]
+        recv = current_io[1] - self._prev_net_io[1]
         self._prev_net_io = current_io
         self.network_history.append(max(sent, recv))
+        return NetworkMetrics(bytes_sent=sent, bytes_recv=recv, connections=self._cached_connections())
 
-        connections: List[Tuple[str, str, str]] = []
-        for conn in psutil.net_connections():
-            laddr = f"{conn.laddr.ip}:{conn.laddr.port}" if conn.laddr else ""
-            raddr = f"{conn.raddr.ip}:{conn.raddr.port}" if conn.raddr else ""
-            status = conn.status
-            connections.append((conn.type.name if hasattr(conn.type, "name") else str(conn.type), laddr, raddr or status))
-        return NetworkMetrics(bytes_sent=sent, bytes_recv=recv, connections=connections)
+    def _cached_connections(self) -> List[Any]:
+        now = time.monotonic()
+        if now - self._connections_ts < self.CONNECTIONS_TTL:
+            return self._connections
+        # Rows are kept as psutil returns them and only formatted when shown.
+        connections = psutil.net_connections(kind=self.connection_kind)
+        self._connections = connections
+        self._connections_ts = now
+        return connections
 
     def running_processes(self, limit: int = 50) -> List[Tuple[int, str, float]]:
-        processes: List[Tuple[int, str, float]] = []
+        # psutil's first cpu_percent call reports 0.0 for every process, so the
+        # priming pass keeps idle rows rather than leaving the table empty.
+        keep_idle = not self._processes_primed
+        self._processes_primed = True
+        # Stream rows into a bounded heap instead of sorting every process.
+        return heapq.nlargest(limit, self._iter_processes(keep_idle), key=itemgetter(2))
+
+    @staticmethod
+    def _iter_processes(keep_idle: bool = False) -> Iterator[Tuple[int, str, float]]:
         for proc in psutil.process_iter(["pid", "name", "cpu_percent"]):
             try:
-                processes.append((proc.info["pid"], proc.info["name"], proc.info["cpu_percent"]))
+                info = proc.info
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 continue
-        processes.sort(key=lambda item: item[2], reverse=True)
-        return processes[:limit]
+            # Once primed, idle processes (0.0) and unreadable ones (None) are
+            # noise for a top-CPU table, so they never reach the heap.
+            if info["cpu_percent"] or keep_idle:
+                yield info["pid"], info["name"], info["cpu_percent"] or 0.0
 
@@ -1,10 +1,21 @@
 from __future__ import annotations
 
+import glob
 import json
+import os
 import shutil
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+try:
+    import dbus
+except ImportError:  # optional; systemctl is used when dbus-python is missing
+    dbus = None
 
 from .logging_config import get_logger
 
@@ -14,41 +25,110 @@ CPU_GOVERNOR_PATH = Path("/sys/devices/system/cpu")
 SWAPPINESS_PATH = Path("/proc/sys/vm/swappiness")
 DROP_CACHES_PATH = Path("/proc/sys/vm/drop_caches")
 SYSTEMD_PATH = Path("/usr/bin/systemctl")
+SYSFS_WORKERS = 32
+
+
+@dataclass(slots=True)
+class ServiceInfo:
+    name: str
+    load: str
+    active: str
+    sub: str
 
 
 class ServiceManager:
-    """Handle systemd service management."""
+    """Handle systemd service management.
+
+    Units are listed over D-Bus when dbus-python is available, which saves
+    spawning systemctl and decoding its JSON on every refresh. The list is
+    reused for `CACHE_TTL` seconds and dropped whenever an action runs.
+    """
 
-    def list_services(self) -> List[Dict[str, str]]:
+    CACHE_TTL = 2.0
+
+    def __init__(self) -> None:
+        self._systemd = self._connect_systemd()
+        self._cache: Optional[List[ServiceInfo]] = None
+        self._cache_ts = 0.0
+
+    @staticmethod
+    def _connect_systemd() -> Optional[Any]:
+        if dbus is None:
+            return None
+        try:
+            proxy = dbus.SystemBus().get_object("org.freedesktop.systemd1", "/org/freedesktop/systemd1")
+            return dbus.Interface(proxy, "org.freedesktop.systemd1.Manager")
+        except dbus.exceptions.DBusException as exc:
+            optimizer_logger.warning("systemd D-Bus API unavailable, using systemctl: %s", exc)
+            return None
+
+    def list_services(self) -> List[ServiceInfo]:
+        now = time.monotonic()
+        if self._cache is None or now - self._cache_ts > self.CACHE_TTL:
+            self._cache = self._fetch_services()
+            self._cache_ts = now
+        return self._cache
+
+    def invalidate_cache(self) -> None:
+        self._cache = None
+
+    def _fetch_services(self) -> List[ServiceInfo]:
+        if self._systemd is not None:
+            try:
+                return self._list_services_dbus()
+            except dbus.exceptions.DBusException as exc:
+                optimizer_logger.error("Failed to list services over D-Bus: %s", exc)
+        return self._list_services_systemctl()
+
+    def _list_services_dbus(self) -> List[ServiceInfo]:
+        # ListUnits rows: (name, description, load, active, sub, following, path, job id, job type, job path).
+        return [
+            ServiceInfo(name=str(unit[0])[: -len(".service")], load=str(unit[2]), active=str(unit[3]), sub=str(unit[4]))
+            for unit in self._systemd.ListUnits()
+            if unit[0].endswith(".service")
+        ]
+
+    def _list_services_systemctl(self) -> List[ServiceInfo]:
+        # The plain table has the four columns we show first and needs no JSON
+        # decoding: "UNIT LOAD ACTIVE SUB DESCRIPTION", one unit per line.
         try:
             output = subprocess.run(
-                ["systemctl", "list-units", "--type=service", "--all", "--output=json"],
+                ["systemctl", "list-units", "--type=service", "--all", "--plain", "--no-legend", "--no-pager"],
                 capture_output=True,
                 text=True,
                 check=True,
             ).stdout
-            services = json.loads(output)
-            return [
-                {
-                    "name": svc.get("unit", "").replace(".service", ""),
-                    "active": svc.get("active", "unknown"),
-                    "sub": svc.get("sub", "unknown"),
-                    "load": svc.get("load", "unknown"),
-                }
-                for svc in services
-            ]
-        except (subprocess.CalledProcessError, json.JSONDecodeError) as exc:
+        except subprocess.CalledProcessError as exc:
             optimizer_logger.error("Failed to list services: %s", exc)
             return []
+        services: List[ServiceInfo] = []
+        for line in output.splitlines():
+            fields = line.split(None, 4)
+            if len(fields) < 4:
+                continue
+            services.append(
+                ServiceInfo(name=fields[0].removesuffix(".service"), load=fields[1], active=fields[2], sub=fields[3])
+            )
+        return services
 
     def _run_action(self, service: str, action: str) -> bool:
+        return self._systemctl(action, [service])
+
+    def _systemctl(self, action: str, services: Sequence[str]) -> bool:
+        names = ", ".join(services)
         try:
-            subprocess.run([SYSTEMD_PATH, action, service], check=True, capture_output=True)
-            optimizer_logger.info("%s service %s", action.capitalize(), service)
+            # Only stderr is ever read, and only to report a failure.
+            subprocess.run([SYSTEMD_PATH, action, *services], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+            optimizer_logger.info("%s service %s", action.capitalize(), names)
             return True
         except subprocess.CalledProcessError as exc:
-            optimizer_logger.error("Failed to %s %s: %s", action, service, exc)
+            optimizer_logger.error("Failed to %s %s: %s", action, names, _failure_detail(exc))
             return False
+        finally:
+            # Drop the cache only once the action is done (even a failed one may
+            # have changed unit state part way), so a listing taken while it ran
+            # cannot be served afterwards.
+            self.invalidate_cache()
 
     def start_service(self, service: str) -> bool:
         return self._run_action(service, "start")
@@ -62,42 +142,138 @@ class ServiceManager:
     def disable_service(self, service: str) -> bool:
         return self._run_action(service, "disable")
 
+    def disable_services(self, services: Sequence[str]) -> List[str]:
+        """Disable `services` with one systemctl call and return the ones disabled.
+
+        If the batch fails, each service is retried on its own so one broken
+        unit does not hold back the rest.
+        """
+        if not services:
+            return []
+        if self._systemctl("disable", services):
+            return list(services)
+        return [service for service in services if self.disable_service(service)]
+
+
+def _failure_detail(exc: subprocess.CalledProcessError) -> str:
+    """Prefer the command's own error message over the bare exit status."""
+    stderr = exc.stderr.decode(errors="ignore").strip() if exc.stderr else ""
+    return stderr or str(exc)
+
+
+def _read_sysfs(path: str) -> str:
+    """Read a small sysfs attribute with a single raw read."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, 4096).decode().strip()
+    finally:
+        os.close(fd)
+
+
+def _write_sysfs(path: str, value: str) -> None:
+    """Write a small sysfs attribute with a single raw write."""
+    fd = os.open(path, os.O_WRONLY)
+    try:
+        os.write(fd, value.encode())
+    finally:
+        os.close(fd)
+
+
+def _cpu_name(cpufreq_file: str) -> str:
+    return os.path.basename(os.path.dirname(os.path.dirname(cpufreq_file)))
+
+
+@lru_cache(maxsize=None)
+def _cpufreq_paths(attribute: str) -> Tuple[str, ...]:
+    """Return `attribute` in every cpu*/cpufreq directory, globbed once until `CpuTuner.refresh_topology`."""
+    return tuple(sorted(glob.glob(os.path.join(CPU_GOVERNOR_PATH, "cpu[0-9]*/cpufreq", attribute))))
+
 
 class CpuTuner:
-    """Handle CPU governor adjustments."""
+    """Handle CPU governor adjustments.
+
+    Per-CPU sysfs reads and writes are fanned out over a thread pool; on
+    many-core machines they are otherwise hundreds of back-to-back syscalls.
+    """
+
+    def __init__(self) -> None:
+        self._available_governors: Optional[List[str]] = None
+
+    def refresh_topology(self) -> None:
+        """Forget the cached cpufreq paths and governors, e.g. after CPU hotplug."""
+        _cpufreq_paths.cache_clear()
+        self._available_governors = None
+
+    @staticmethod
+    def _fan_out(func: Callable[[str], Any], paths: Sequence[str]) -> List[Any]:
+        if len(paths) <= 1:
+            return [func(path) for path in paths]
+        with ThreadPoolExecutor(max_workers=min(SYSFS_WORKERS, len(paths))) as pool:
+            return list(pool.map(func, paths))
 
     def available_governors(self) -> List[str]:
-        governors: List[str] = []
-        for cpu_path in CPU_GOVERNOR_PATH.glob("cpu[0-9]*/cpufreq/scaling_available_governors"):
+        # The governors a kernel offers do not change while it is running.
+        if self._available_governors is None:
+            self._available_governors = self._read_available_governors()
+        return list(self._available_governors)
+
+    def _read_available_governors(self) -> List[str]:
+        def read(cpu_path: str) -> List[str]:
             try:
-                content = cpu_path.read_text().strip()
+                return _read_sysfs(cpu_path).split()
             except FileNotFoundError:
-                continue
-            governors.extend(content.split())
-        return sorted(set(governors))
+                return []
+
+        governors: Set[str] = set()
+        for names in self._fan_out(read, _cpufreq_paths("scaling_available_governors")):
+            governors.update(names)
+        return sorted(governors)
 
     def current_governor(self) -> Optional[str]:
-        for cpu_path in CPU_GOVERNOR_PATH.glob("cpu[0-9]*/cpufreq/scaling_governor"):
+        for cpu_path in _cpufreq_paths("scaling_governor"):
             try:
-                return cpu_path.read_text().strip()
+                return _read_sysfs(cpu_path)
             except FileNotFoundError:
                 continue
         return None
 
     def set_governor(self, governor: str) -> bool:
-        success = True
-        for cpu_path in CPU_GOVERNOR_PATH.glob("cpu[0-9]*/cpufreq/scaling_governor"):
+        def write(cpu_path: str) -> bool:
             try:
-                cpu_path.write_text(governor)
-                optimizer_logger.info("CPU governor set to %s for %s", governor, cpu_path.parent.name)
+                _write_sysfs(cpu_path, governor)
+                optimizer_logger.info("CPU governor set to %s for %s", governor, _cpu_name(cpu_path))
+                return True
             except (FileNotFoundError, PermissionError) as exc:
-                optimizer_logger.error("Failed to set governor for %s: %s", cpu_path.parent.name, exc)
-                success = False
-        return success
+                optimizer_logger.error("Failed to set governor for %s: %s", _cpu_name(cpu_path), exc)
+                return False
+
+        return all(self._fan_out(write, _cpufreq_paths("scaling_governor")))
 
 
 class MemoryTuner:
-    """Adjust memory-related settings."""
+    """Adjust memory-related settings.
+
+    The procfs knobs are opened on first write and kept open, so repeated
+    writes (e.g. from the swappiness slider) are a single pwrite each.
+    """
+
+    def __init__(self) -> None:
+        self._fds: Dict[Path, int] = {}
+
+    def __del__(self) -> None:
+        self.close()
+
+    def close(self) -> None:
+        for fd in self._fds.values():
+            os.close(fd)
+        self._fds.clear()
+
+    def _write(self, path: Path, value: str) -> None:
+        fd = self._fds.get(path)
+        if fd is None:
+            fd = os.open(path, os.O_WRONLY | os.O_CLOEXEC)
+            self._fds[path] = fd
+        os.pwrite(fd, value.encode(), 0)
 
     def swappiness(self) -> Optional[int]:
         try:
@@ -108,7 +284,7 @@ class MemoryTuner:
 
     def set_swappiness(self, value: int) -> bool:
         try:
-            SWAPPINESS_PATH.write_text(str(value))
+            self._write(SWAPPINESS_PATH, str(value))
             optimizer_logger.info("Swappiness set to %d", value)
             return True
         except (FileNotFoundError, PermissionError) as exc:
@@ -117,7 +293,7 @@ class MemoryTuner:
 
     def clear_cache(self) -> bool:
         try:
-            DROP_CACHES_PATH.write_text("3\n")
+            self._write(DROP_CACHES_PATH, "3\n")
             optimizer_logger.info("Cleared page cache, dentries, and inodes")
             return True
         except (FileNotFoundError, PermissionError) as exc:
@@ -133,26 +309,38 @@ class DiskCleaner:
     def clean_temp_files(self) -> List[Path]:
         removed: List[Path] = []
         for temp_dir in self.TEMP_DIRS:
-            if not temp_dir.exists():
+            try:
+                entries = os.scandir(temp_dir)
+            except FileNotFoundError:
                 continue
-            for item in temp_dir.iterdir():
-                try:
-                    if item.is_dir():
-                        shutil.rmtree(item)
-                    else:
-                        item.unlink()
-                    removed.append(item)
-                    optimizer_logger.info("Removed temporary file %s", item)
-                except (PermissionError, OSError) as exc:
-                    optimizer_logger.error("Failed to remove %s: %s", item, exc)
+            with entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            # rmtree walks by fd with O_NOFOLLOW, so a directory swapped
+                            # for a symlink in /tmp cannot redirect the delete.
+                            shutil.rmtree(entry.path)
+                        else:
+                            os.unlink(entry.path)
+                        removed.append(Path(entry.path))
+                        optimizer_logger.debug("Removed temporary file %s", entry.path)
+                    except OSError as exc:
+                        optimizer_logger.error("Failed to remove %s: %s", entry.path, exc)
+        optimizer_logger.info("Removed %d temporary entries", len(removed))
         return removed
 
     def clean_package_cache(self) -> bool:
-        commands = [
-            ["apt", "clean"],
-            ["apt", "autoremove", "-y"],
-            ["journalctl", "--vacuum-time=7d"],
+        # Both apt commands take the dpkg lock and must run in order; the
+        # journal vacuum touches unrelated files and runs alongside them.
+        command_groups = [
+            [["apt", "clean"], ["apt", "autoremove", "-y"]],
+            [["journalctl", "--vacuum-time=7d"]],
         ]
+        with ThreadPoolExecutor(max_workers=len(command_groups)) as pool:
+            return all(pool.map(self._run_commands, command_groups))
+
+    @staticmethod
+    def _run_commands(commands: List[List[str]]) -> bool:
         success = True
         for command in commands:
             try:
@@ -167,9 +355,17 @@ class DiskCleaner:
 class SystemTuner:
     """Provide simple recommendations based on current system state."""
 
-    def recommendations(self, services: Iterable[Dict[str, str]]) -> List[str]:
+    def __init__(self, service_manager: Optional[ServiceManager] = None) -> None:
+        self.service_manager = service_manager or ServiceManager()
+
+    @staticmethod
+    def _inactive(services: Iterable[ServiceInfo]) -> List[ServiceInfo]:
+        """Return the services a recommendation would disable, consuming `services` once."""
+        return [svc for svc in services if svc.active == "inactive"]
+
+    def recommendations(self, services: Iterable[ServiceInfo]) -> List[str]:
         recs: List[str] = []
-        inactive = [svc for svc in services if svc.get("active") == "inactive"]
+        inactive = self._inactive(services)
         if inactive:
             recs.append(f"Disable {len(inactive)} inactive services to free resources")
         if shutil.disk_usage("/").free < 5 * 1024 ** 3:
@@ -179,15 +375,13 @@ class SystemTuner:
         optimizer_logger.info("Generated %d recommendations", len(recs))
         return recs
 
-    def apply_recommendations(self, services: Iterable[Dict[str, str]]) -> List[str]:
+    def apply_recommendations(self, services: Iterable[ServiceInfo]) -> List[str]:
         applied: List[str] = []
-        service_manager = ServiceManager()
-        for svc in services:
-            if svc.get("active") == "inactive":
-                if service_manager.disable_service(svc["name"]):
-                    message = f"Disabled service {svc['name']}"
-                    applied.append(message)
-                    optimizer_logger.info(message)
+        inactive = [svc.name for svc in self._inactive(services)]
+        for name in self.service_manager.disable_services(inactive):
+            message = f"Disabled service {name}"
+            applied.append(message)
+            optimizer_logger.info(message)
         return applied
 
 
@@ -0,0 +1,133 @@
+"""Background workers that keep slow operations off the Qt event loop."""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Callable, List
+
+from PyQt5 import QtCore
+
+from .file_manager import FileInfo
+from .logging_config import get_logger
+from .monitor import SystemMonitor
+
+worker_logger = get_logger("Workers")
+
+
+class WorkerSignals(QtCore.QObject):
+    """Signal carrier for `QRunnable`, which cannot define signals itself."""
+
+    finished = QtCore.pyqtSignal(list)
+
+
+class ScanWorker(QtCore.QRunnable):
+    """Run a disk scan or file search on a pool thread."""
+
+    def __init__(self, scan: Callable[[], List[FileInfo]]) -> None:
+        super().__init__()
+        self.scan = scan
+        self.signals = WorkerSignals()
+
+    def run(self) -> None:
+        try:
+            results = self.scan()
+        except Exception as exc:
+            worker_logger.error("File scan failed: %s", exc)
+            results = []
+        self.signals.finished.emit(results)
+
+
+class TaskSignals(QtCore.QObject):
+    finished = QtCore.pyqtSignal(object)
+
+
+class TaskWorker(QtCore.QRunnable):
+    """Run a one-off blocking call on a pool thread and emit its result.
+
+    `finished` carries the call's return value, or None if it raised.
+    """
+
+    def __init__(self, task: Callable[[], Any], description: str) -> None:
+        super().__init__()
+        self.task = task
+        self.description = description
+        self.signals = TaskSignals()
+
+    def run(self) -> None:
+        try:
+            result = self.task()
+        except Exception as exc:
+            worker_logger.error("%s failed: %s", self.description, exc)
+            result = None
+        self.signals.finished.emit(result)
+
+
+class MonitorWorker(QtCore.QObject):
+    """Sample a `SystemMonitor` on a timer owned by the worker's thread.
+
+    Move the worker to a `QThread` and connect the thread's `started` signal
+    to `start`; every tick emits a `MonitorSnapshot` through `snapshot`.
+
+    CPU, memory and IO counters are read every tick. The process table is
+    only walked every `process_interval_ms`; the slower-moving connection,
+    partition and disk usage readings are throttled by `SystemMonitor` itself.
+    """
+
+    snapshot = QtCore.pyqtSignal(object)
+
+    def __init__(
+        self,
+        monitor: SystemMonitor,
+        interval_ms: int = 1000,
+        process_limit: int = 20,
+        process_interval_ms: int = 5000,
+    ) -> None:
+        super().__init__()
+        self.monitor = monitor
+        self.interval_ms = interval_ms
+        self.process_limit = process_limit
+        self.process_interval_ms = process_interval_ms
+        self._sample_processes = True
+        self._last_process_sample = float("-inf")
+        self._timer: QtCore.QTimer | None = None
+
+    @property
+    def sample_processes(self) -> bool:
+        """Whether the process table is sampled; only while someone is looking at it."""
+        return self._sample_processes
+
+    @sample_processes.setter
+    def sample_processes(self, enabled: bool) -> None:
+        if enabled and not self._sample_processes:
+            # Coming back into view: refresh on the next tick rather than showing a stale list.
+            self._last_process_sample = float("-inf")
+        self._sample_processes = enabled
+
+    @QtCore.pyqtSlot()
+    def start(self) -> None:
+        self._timer = QtCore.QTimer(self)
+        # A coarse timer may drift by up to 5% per tick, which shows up as uneven chart spacing.
+        self._timer.setTimerType(QtCore.Qt.PreciseTimer)
+        self._timer.timeout.connect(self.sample)
+        self._timer.start(self.interval_ms)
+        self.sample()
+
+    @QtCore.pyqtSlot()
+    def stop(self) -> None:
+        if self._timer is not None:
+            self._timer.stop()
+
+    @QtCore.pyqtSlot()
+    def sample(self) -> None:
+        now = time.monotonic()
+        with_processes = (
+            self._sample_processes and (now - self._last_process_sample) * 1000 >= self.process_interval_ms
+        )
+        try:
+            snapshot = self.monitor.snapshot(self.process_limit if with_processes else None)
+        except Exception as exc:
+            worker_logger.error("Failed to sample system metrics: %s", exc)
+            return
+        if with_processes:
+            self._last_process_sample = now
+        self.snapshot.emit(snapshot)
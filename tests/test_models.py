@@ -0,0 +1,89 @@
+"""Run the table models under Qt's QAbstractItemModelTester."""
+
+from __future__ import annotations
+
+import os
+import unittest
+from pathlib import Path
+from typing import List
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5 import QtCore, QtWidgets
+from PyQt5.QtTest import QAbstractItemModelTester
+
+from system_optimizer.file_manager import FileInfo
+from system_optimizer.models import FileModel, ProcessModel
+
+_app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+class RowTableModelTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.failures: List[str] = []
+        self._previous_handler = QtCore.qInstallMessageHandler(self._record)
+        self.model = ProcessModel()
+        self.tester = QAbstractItemModelTester(
+            self.model, QAbstractItemModelTester.FailureReportingMode.Warning
+        )
+
+    def tearDown(self) -> None:
+        QtCore.qInstallMessageHandler(self._previous_handler)
+
+    def _record(self, mode: QtCore.QtMsgType, context: QtCore.QMessageLogContext, message: str) -> None:
+        if "FAIL!" in message:
+            self.failures.append(message)
+
+    def _rows(self, *pids: int) -> List[tuple]:
+        return [(pid, f"proc{pid}", pid / 2) for pid in pids]
+
+    def _assert_shows(self, rows: List[tuple]) -> None:
+        self.assertEqual(self.failures, [])
+        self.assertEqual(self.model.rowCount(), len(rows))
+        for row, values in enumerate(rows):
+            self.assertEqual(self.model.data(self.model.index(row, 0)), str(values[0]))
+            self.assertEqual(self.model.data(self.model.index(row, 1)), values[1])
+
+    def test_grow_with_changed_rows(self) -> None:
+        self.model.set_rows(self._rows(1, 2))
+        rows = self._rows(5, 2, 3, 4)
+        self.model.set_rows(rows)
+        self._assert_shows(rows)
+
+    def test_shrink_with_changed_rows(self) -> None:
+        self.model.set_rows(self._rows(1, 2, 3, 4))
+        rows = self._rows(1, 9)
+        self.model.set_rows(rows)
+        self._assert_shows(rows)
+
+    def test_same_length_and_clear(self) -> None:
+        self.model.set_rows(self._rows(1, 2))
+        self.model.set_rows(self._rows(3, 4))
+        self._assert_shows(self._rows(3, 4))
+        self.model.set_rows([])
+        self._assert_shows([])
+
+    def test_append_rows(self) -> None:
+        self.model.set_rows(self._rows(1))
+        self.model.append_rows(self._rows(7))
+        self._assert_shows(self._rows(1, 7))
+
+
+class FileModelTest(unittest.TestCase):
+    def _files(self, prefix: str) -> List[FileInfo]:
+        return [FileInfo(path=Path(f"/{prefix}/{index}"), size=index) for index in range(4)]
+
+    def test_new_results_drop_the_selection(self) -> None:
+        model = FileModel()
+        view = QtWidgets.QTableView()
+        view.setModel(model)
+        model.set_rows(self._files("old"))
+        view.selectRow(2)
+        self.assertEqual([model.path_at(index.row()) for index in view.selectionModel().selectedRows()], [Path("/old/2")])
+        model.set_rows(self._files("new"))
+        self.assertEqual(view.selectionModel().selectedRows(), [])
+        self.assertEqual(model.path_at(2), Path("/new/2"))
+
+
+if __name__ == "__main__":
+    unittest.main()